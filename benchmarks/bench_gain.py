@@ -0,0 +1,65 @@
+"""PCM 볼륨 조절 마이크로 벤치마크 (코어 하나당 초당 처리 프레임 수)
+
+실시간 재생은 스트림당 초당 50프레임이 필요하므로, 결과를 50으로 나누면
+코어 하나로 감당할 수 있는 동시 스트림 수의 상한이 된다.
+
+사용법 (저장소 루트에서):
+    python -m benchmarks.bench_gain --frames 20000
+"""
+import argparse
+import os
+import time
+
+from utils import audio
+from utils.audio import FRAME_SIZE, GainStage
+
+
+def frames_per_second(process, frame: bytes, frames: int) -> float:
+    start = time.process_time()
+    for _ in range(frames):
+        process(frame)
+    elapsed = time.process_time() - start
+    return frames / elapsed if elapsed else float('inf')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--frames', type=int, default=20000)
+    args = parser.parse_args()
+
+    frame = os.urandom(FRAME_SIZE)
+    cases = {}
+
+    unity = GainStage(1.0)
+    cases['unity (skip)'] = unity.process
+
+    if audio.numpy_available():
+        fixed = GainStage(0.5)
+        cases['numpy fixed 0.5'] = fixed.process
+
+        boosted = GainStage(1.5)
+        cases['numpy fixed 1.5 (clip)'] = boosted.process
+
+        ramping = GainStage(0.2)
+
+        def ramp(data):
+            # 매 프레임 목표 볼륨을 바꿔 항상 램프 경로를 타게 한다
+            ramping.set_gain(0.8 if ramping.target < 0.5 else 0.2)
+            return ramping.process(data)
+        cases['numpy ramp'] = ramp
+
+    if audio.audioop is not None:
+        cases['audioop fixed 0.5'] = lambda data: audio.audioop.mul(data, 2, 0.5)
+
+    fallback_frames = max(1, args.frames // 50)
+    cases['pure python ramp'] = lambda data: GainStage._process_fallback(data, 0.2, 0.8)
+
+    print(f"{'case':<24}{'frames/s/core':>15}{'streams/core':>14}")
+    for name, process in cases.items():
+        frames = fallback_frames if name.startswith('pure python') else args.frames
+        fps = frames_per_second(process, frame, frames)
+        print(f"{name:<24}{fps:>15,.0f}{fps / 50:>14,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+"""쿼리 -> 대기열 곡 -> 스트림 URL 파이프라인 오프라인 벤치마크
+
+가짜 YoutubeDL(benchmarks/fake_ytdl.py)을 MusicManager에 주입해 유튜브 접속 없이 측정한다.
+
+사용법 (저장소 루트에서):
+    python -m benchmarks.bench_pipeline
+    python -m benchmarks.bench_pipeline --scenarios playlist-500 --no-flat-titles --failure-rate 0.05
+    python -m benchmarks.bench_pipeline --latency-scale 0.1 --repeat 20
+
+측정 항목: 처리량(곡/초), 요청 지연 p50/p95/p99, 첫 곡 준비까지 걸린 시간, 최대 메모리(tracemalloc)
+"""
+import argparse
+import asyncio
+import dataclasses
+import time
+import tracemalloc
+from typing import Dict, List
+
+from benchmarks.fake_ytdl import FakeSettings, FakeYoutubeDL, playlist_url, video_url
+from config.bot_config import BotConfig
+from services.music_manager import MusicManager
+from utils.exceptions import MusicSourceError
+
+SCENARIOS = {
+    'single': lambda i: video_url(i),
+    'search': lambda i: f"fixture song {i}",
+    'playlist-50': lambda i: playlist_url(50),
+    'playlist-500': lambda i: playlist_url(500),
+    'playlist-5000': lambda i: playlist_url(5000),
+}
+
+
+def percentile(values: List[float], p: float) -> float:
+    if not values:
+        return float('nan')
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+
+async def run_scenario(name: str, args, settings: FakeSettings) -> Dict[str, float]:
+    config = dataclasses.replace(
+        BotConfig.load_config(),
+        METADATA_CACHE_PATH=None,
+        QUEUE_STORE_PATH=None,
+        SEARCH_CACHE_PERSIST=False,
+        PLAYLIST_CONCURRENCY=args.concurrency,
+        YTDL_POOL_SIZE=args.concurrency + 2
+    )
+    manager = MusicManager(config, ydl_factory=FakeYoutubeDL.factory(settings))
+    loop = asyncio.get_running_loop()
+    repeat = 1 if name.startswith('playlist-') and not args.repeat_playlists else args.repeat
+
+    latencies: List[float] = []
+    first_track: List[float] = []
+    resolve_latencies: List[float] = []
+    tracks_total = 0
+    failures = 0
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    for i in range(repeat):
+        query = SCENARIOS[name](i)
+        request_started = time.perf_counter()
+        first = []
+
+        def on_track(_track):
+            if not first:
+                first.append(time.perf_counter() - request_started)
+
+        try:
+            tracks = await manager.process_query(query, loop, on_track=on_track)
+        except MusicSourceError:
+            failures += 1
+            continue
+        latencies.append(time.perf_counter() - request_started)
+        first_track.extend(first)
+        tracks_total += len(tracks)
+
+        # 첫 곡은 재생 직전 단계(스트림 URL 확인)까지 측정
+        if tracks and args.resolve:
+            resolve_started = time.perf_counter()
+            await manager.resolve_stream_data(tracks[0], loop)
+            resolve_latencies.append(time.perf_counter() - resolve_started)
+
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    manager.close()
+
+    return {
+        'requests': repeat,
+        'failures': failures,
+        'tracks': tracks_total,
+        'elapsed': elapsed,
+        'tracks_per_sec': tracks_total / elapsed if elapsed else 0,
+        'p50': percentile(latencies, 50),
+        'p95': percentile(latencies, 95),
+        'p99': percentile(latencies, 99),
+        'first_track_p50': percentile(first_track, 50),
+        'resolve_p50': percentile(resolve_latencies, 50),
+        'peak_mib': peak / 1024 / 1024,
+    }
+
+
+def print_report(results: Dict[str, Dict[str, float]]):
+    header = (f"{'scenario':<15}{'req':>5}{'fail':>6}{'tracks':>8}{'tracks/s':>10}"
+              f"{'p50(s)':>9}{'p95(s)':>9}{'p99(s)':>9}{'first(s)':>10}{'resolve(s)':>12}{'peak(MiB)':>11}")
+    print(header)
+    print('-' * len(header))
+    for name, r in results.items():
+        print(f"{name:<15}{r['requests']:>5}{r['failures']:>6}{r['tracks']:>8}{r['tracks_per_sec']:>10.1f}"
+              f"{r['p50']:>9.3f}{r['p95']:>9.3f}{r['p99']:>9.3f}{r['first_track_p50']:>10.3f}"
+              f"{r['resolve_p50']:>12.3f}{r['peak_mib']:>11.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scenarios', nargs='+', default=list(SCENARIOS), choices=list(SCENARIOS))
+    parser.add_argument('--repeat', type=int, default=10, help='단일 영상/검색 시나리오 반복 횟수')
+    parser.add_argument('--repeat-playlists', action='store_true', help='재생목록 시나리오도 --repeat만큼 반복')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--latency-scale', type=float, default=1.0, help='가짜 추출 지연 배율')
+    parser.add_argument('--failure-rate', type=float, default=0.0)
+    parser.add_argument('--no-flat-titles', action='store_true', help='재생목록 항목마다 상세 추출 강제')
+    parser.add_argument('--no-resolve', dest='resolve', action='store_false', help='스트림 URL 확인 단계 제외')
+    args = parser.parse_args()
+
+    base = FakeSettings()
+    settings = dataclasses.replace(
+        base,
+        search_latency=base.search_latency * args.latency_scale,
+        playlist_latency=base.playlist_latency * args.latency_scale,
+        video_latency=base.video_latency * args.latency_scale,
+        failure_rate=args.failure_rate,
+        flat_titles=not args.no_flat_titles
+    )
+
+    async def run_all():
+        return {name: await run_scenario(name, args, settings) for name in args.scenarios}
+
+    print_report(asyncio.run(run_all()))
+
+
+if __name__ == '__main__':
+    main()
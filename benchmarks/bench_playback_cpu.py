@@ -0,0 +1,102 @@
+"""재생 경로별 스트림당 CPU 사용량 비교 (PCM 경로 vs Opus 패스스루)
+
+PCM 경로는 실제 음성 전송과 같이 FFmpeg PCM 디코딩 + GainStage 볼륨 조절 + Opus 인코딩까지,
+Opus 경로는 FFmpeg이 만든 Opus 패킷 읽기까지 측정한다.
+스트림마다 스레드 하나로 최대 속도로 읽고, FFmpeg 자식 프로세스의 CPU 시간도 합산한다.
+
+사용법 (저장소 루트에서, ffmpeg와 libopus 필요):
+    python -m benchmarks.bench_playback_cpu --input sample.webm --streams 4 --seconds 60
+    python -m benchmarks.bench_playback_cpu --input sample.webm --volume 1.0
+"""
+import argparse
+import asyncio
+import dataclasses
+import os
+import threading
+import time
+
+import discord
+
+from config.bot_config import BotConfig
+from services.music_manager import MusicManager
+
+
+def drain(source, frames: int, encode: bool, counts: list):
+    """음성 전송 스레드처럼 20ms 프레임을 읽는다 (PCM이면 Opus 인코딩까지)"""
+    encoder = discord.opus.Encoder() if encode else None
+    read = 0
+    try:
+        for _ in range(frames):
+            data = source.read()
+            if not data:
+                break
+            if encoder:
+                encoder.encode(data, encoder.SAMPLES_PER_FRAME)
+            read += 1
+    finally:
+        source.cleanup()
+    counts.append(read)
+
+
+def measure(mode: str, args, acodec: str) -> dict:
+    config = dataclasses.replace(
+        BotConfig.load_config(),
+        METADATA_CACHE_PATH=None,
+        QUEUE_STORE_PATH=None,
+        PLAYBACK_MODE=mode,
+        PLAYBACK_VOLUME=args.volume
+    )
+    manager = MusicManager(config)
+    data = {'id': 'bench', 'title': 'bench', 'url': args.input, 'acodec': acodec}
+    frames = int(args.seconds / 0.02)
+
+    before = os.times()
+    started = time.perf_counter()
+    counts: list = []
+    threads = []
+    for _ in range(args.streams):
+        source = manager.build_audio_source(data, before_options=None)
+        thread = threading.Thread(target=drain, args=(source, frames, not source.is_opus(), counts))
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    after = os.times()
+    manager.close()
+
+    own_cpu = (after.user - before.user) + (after.system - before.system)
+    child_cpu = (after.children_user - before.children_user) + (after.children_system - before.children_system)
+    audio_seconds = sum(counts) * 0.02
+    return {
+        'elapsed': elapsed,
+        'audio_seconds': audio_seconds,
+        'own_cpu': own_cpu,
+        'ffmpeg_cpu': child_cpu,
+        # 실시간 1초 재생에 드는 CPU 시간 = 실시간 재생 시 스트림 하나의 CPU 점유율
+        'cpu_per_stream': (own_cpu + child_cpu) / audio_seconds * 100 if audio_seconds else float('nan'),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--input', required=True, help='로컬 오디오 파일 (예: yt-dlp로 받은 webm/opus)')
+    parser.add_argument('--streams', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=60, help='스트림당 읽을 오디오 길이')
+    parser.add_argument('--volume', type=float, default=BotConfig.load_config().PLAYBACK_VOLUME)
+    args = parser.parse_args()
+
+    if not discord.opus.is_loaded():
+        discord.opus._load_default()
+
+    acodec, _ = asyncio.run(discord.FFmpegOpusAudio.probe(args.input))
+    print(f"input={args.input} acodec={acodec} streams={args.streams} volume={args.volume}")
+    print(f"{'mode':<6}{'audio(s)':>10}{'wall(s)':>9}{'python cpu(s)':>15}{'ffmpeg cpu(s)':>15}{'cpu/stream(%)':>15}")
+    for mode in ('pcm', 'opus'):
+        r = measure(mode, args, acodec)
+        print(f"{mode:<6}{r['audio_seconds']:>10.1f}{r['elapsed']:>9.2f}{r['own_cpu']:>15.2f}"
+              f"{r['ffmpeg_cpu']:>15.2f}{r['cpu_per_stream']:>15.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""YoutubeDL 매 호출 생성 방식과 풀 재사용 방식 비교
+
+사용법 (저장소 루트에서):
+    python -m benchmarks.bench_ytdl_pool --calls 200 --threads 8
+    python -m benchmarks.bench_ytdl_pool --calls 20 --url https://www.youtube.com/watch?v=...
+
+--url을 주지 않으면 인스턴스 생성/초기화 비용만 측정하고, 주면 실제 extract_info까지 포함한다.
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import yt_dlp
+
+from config.bot_config import BotConfig
+from services.ytdl_pool import YoutubeDLPool
+
+
+def run_per_call(options, calls: int, threads: int, url: str = None) -> float:
+    """기존 방식: 호출마다 YoutubeDL 생성"""
+    def task(_):
+        with yt_dlp.YoutubeDL(dict(options)) as ydl:
+            if url:
+                ydl.extract_info(url, download=False)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(task, range(calls)))
+    return time.perf_counter() - start
+
+
+def run_pooled(options, calls: int, threads: int, url: str = None) -> float:
+    """풀 방식: 미리 만든 인스턴스 재사용"""
+    pool = YoutubeDLPool(options, threads)
+
+    def task(_):
+        with pool.checkout() as ydl:
+            if url:
+                ydl.extract_info(url, download=False)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(task, range(calls)))
+    elapsed = time.perf_counter() - start
+    pool.close()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--calls', type=int, default=200)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--url', default=None)
+    args = parser.parse_args()
+
+    options = BotConfig.load_config().YTDLP_FORMAT_OPTIONS.copy()
+    options['extract_flat'] = False
+
+    per_call = run_per_call(options, args.calls, args.threads, args.url)
+    pooled = run_pooled(options, args.calls, args.threads, args.url)
+
+    print(f"calls={args.calls} threads={args.threads} url={'yes' if args.url else 'no'}")
+    print(f"per-call : {per_call:.3f}s ({per_call / args.calls * 1000:.2f} ms/call)")
+    print(f"pooled   : {pooled:.3f}s ({pooled / args.calls * 1000:.2f} ms/call)")
+    print(f"speedup  : {per_call / pooled:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
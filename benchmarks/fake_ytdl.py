@@ -0,0 +1,132 @@
+"""네트워크 없이 extract_info 결과를 흉내내는 가짜 YoutubeDL
+
+fixtures/ 의 JSON을 틀로 사용해 실제 yt-dlp와 같은 모양의 결과를 만든다.
+재생목록 URL의 list 파라미터가 'PL-<개수>' 형태면 해당 개수만큼 항목을 만든다.
+"""
+import copy
+import json
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+def load_fixture(name: str) -> Dict[str, Any]:
+    with open(os.path.join(FIXTURE_DIR, f'{name}.json'), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def playlist_url(size: int) -> str:
+    """가짜 재생목록 URL 생성"""
+    return f"https://www.youtube.com/playlist?list=PL-{size}"
+
+
+def video_url(index: int) -> str:
+    """가짜 영상 URL 생성 (11자리 ID)"""
+    return f"https://www.youtube.com/watch?v=fx{index:09d}"
+
+
+@dataclass
+class FakeSettings:
+    """가짜 추출기 동작 설정"""
+    search_latency: float = 0.4
+    playlist_latency: float = 0.8
+    video_latency: float = 0.3
+    latency_jitter: float = 0.2
+    failure_rate: float = 0.0
+    # False면 플랫 항목에서 제목/길이를 빼서 항목마다 상세 추출이 일어나게 한다
+    flat_titles: bool = True
+    seed: Optional[int] = 1
+
+
+class FakeYoutubeDL:
+    """yt_dlp.YoutubeDL 대역 (extract_info만 구현)"""
+
+    def __init__(self, options: Dict[str, Any], settings: FakeSettings):
+        self.options = options
+        self.settings = settings
+        self.video = load_fixture('video')
+        self.flat_entry = load_fixture('flat_entry')
+        self.playlist = load_fixture('playlist')
+        self.search = load_fixture('search')
+        self._random = random.Random(settings.seed)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def factory(cls, settings: FakeSettings) -> Callable[[Dict[str, Any]], 'FakeYoutubeDL']:
+        """MusicManager(ydl_factory=...)에 넘길 생성 함수"""
+        return lambda options: cls(options, settings)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def close(self):
+        pass
+
+    def _sleep(self, base: float):
+        with self._lock:
+            jitter = self._random.uniform(-self.settings.latency_jitter, self.settings.latency_jitter)
+            failed = self._random.random() < self.settings.failure_rate
+        time.sleep(max(0.0, base * (1 + jitter)))
+        return failed
+
+    def _fail(self, url: str):
+        if self.options.get('ignoreerrors'):
+            return None
+        raise RuntimeError(f"fake extraction failure: {url}")
+
+    def _video_data(self, video_id: str) -> Dict[str, Any]:
+        data = copy.deepcopy(self.video)
+        data['id'] = video_id
+        data['title'] = f"Fixture Song {video_id}"
+        data['webpage_url'] = data['original_url'] = f"https://www.youtube.com/watch?v={video_id}"
+        data['url'] = data['url'].replace('dQw4w9WgXcQ', video_id)
+        return data
+
+    def _flat_entry(self, video_id: str) -> Dict[str, Any]:
+        entry = copy.deepcopy(self.flat_entry)
+        entry['id'] = video_id
+        entry['url'] = f"https://www.youtube.com/watch?v={video_id}"
+        entry['title'] = f"Fixture Song {video_id}"
+        if not self.settings.flat_titles:
+            entry.pop('title')
+            entry.pop('duration')
+        return entry
+
+    def extract_info(self, url: str, download: bool = False, **kwargs) -> Optional[Dict[str, Any]]:
+        flat = bool(self.options.get('extract_flat'))
+
+        if url.startswith('ytsearch:'):
+            if self._sleep(self.settings.search_latency):
+                return self._fail(url)
+            query = url[len('ytsearch:'):]
+            result = copy.deepcopy(self.search)
+            result['id'] = result['title'] = query
+            result['webpage_url'] = url
+            video_id = f"s{abs(hash(query)) % 10 ** 10:010d}"
+            result['entries'] = [self._flat_entry(video_id) if flat else self._video_data(video_id)]
+            return result
+
+        params = parse_qs(urlparse(url).query)
+        if 'list' in params:
+            if self._sleep(self.settings.playlist_latency):
+                return self._fail(url)
+            size = int(params['list'][0].split('-')[-1])
+            result = copy.deepcopy(self.playlist)
+            result['playlist_count'] = size
+            ids = [f"fx{i:09d}" for i in range(size)]
+            result['entries'] = [self._flat_entry(i) if flat else self._video_data(i) for i in ids]
+            return result
+
+        if self._sleep(self.settings.video_latency):
+            return self._fail(url)
+        video_id = params.get('v', ['dQw4w9WgXcQ'])[0]
+        return self._video_data(video_id)
@@ -1,14 +1,27 @@
-from typing import Optional
+import math
+import os
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
 import discord
 from discord import app_commands
 from discord.ext import commands
 import asyncio
+import time
 
 from config.bot_config import BotConfig
+from models.music_source import Track
+from services.changelog_index import ChangelogIndex
+from services.idle_reaper import EMPTY, IDLE, IdleVoiceReaper
+from services.loop_monitor import LoopMonitor
 from services.music_manager import MusicManager
+from services.panel_store import PanelStore
+from services.system_monitor import SystemSampler
+from services.worker_status import WorkerStatusBoard, aggregate_status
 from ui.views import MusicControlView
 from ui.embeds import MusicEmbeds
-from utils.exceptions import VoiceConnectionError
+from utils.exceptions import FFmpegLimitError, VoiceConnectionError
+from utils.log import get_logger
+
+logger = get_logger(__name__)
 
 
 class MusicBot(commands.Cog):
@@ -17,36 +30,139 @@ class MusicBot(commands.Cog):
         self.config = BotConfig.load_config()
         self.music_manager = MusicManager(self.config)
         self.loop = asyncio.get_event_loop()
+        self.play_locks: Dict[int, asyncio.Lock] = {}
+        self.loading_tasks: Set[asyncio.Task] = set()
+        self.panel_store = PanelStore(self.config.PANEL_STORE_PATH)
+        self.panel_store.load()
+        # 워커 프로세스 모드에서만 워커 상태를 파일로 공유
+        self.status_board: Optional[WorkerStatusBoard] = None
+        self.status_task: Optional[asyncio.Task] = None
+        # CPU/메모리 사용량은 백그라운드에서 미리 측정 (/status에서 기다리지 않도록)
+        self.system_sampler = SystemSampler(
+            interval=self.config.SYSTEM_SAMPLE_INTERVAL,
+            ffmpeg_stats=self.music_manager.get_ffmpeg_stats
+        )
+        self.sampler_task: Optional[asyncio.Task] = None
+        # 이벤트 루프를 오래 막는 작업 추적 (/lag)
+        self.loop_monitor: Optional[LoopMonitor] = None
+        self.loop_monitor_task: Optional[asyncio.Task] = None
+        if self.config.LOOP_LAG_THRESHOLD > 0:
+            self.loop_monitor = LoopMonitor(self.config.LOOP_MONITOR_INTERVAL, self.config.LOOP_LAG_THRESHOLD)
+        if self.config.WORKER_ID is not None:
+            self.status_board = WorkerStatusBoard(self.config.STATUS_DIR, self.config.WORKER_ID)
+        # 재생할 곡이 없거나 음성 채널에 사람이 없는 길드의 연결 종료 예약 (타이머 힙 하나로 관리)
+        self.voice_reaper = IdleVoiceReaper(self.reap_voice_client, self.config.VOICE_REAPER_INTERVAL)
+        self.reaper_task: Optional[asyncio.Task] = None
+        # 연결 종료 안내를 보낼 채널 (길드별 마지막 /play 채널)
+        self.notify_channels: Dict[int, int] = {}
+        # 릴리즈 노트는 시작 시 한 번 읽어 두고, 파일이 바뀌었을 때만 다시 읽음
+        self.changelog = ChangelogIndex(self.config.CHANGELOG_PATH, self.config.PACKAGE_JSON_PATH)
 
     async def cog_load(self):
-        print("MusicBot cog loaded!")
-        await self.initialize_music_channels()
+        logger.info("MusicBot cog loaded")
+        # 저장된 패널 메시지에 영구 뷰를 바로 연결 (API 호출 없음)
+        for _, message_id in list(self.panel_store.panels.values()):
+            self.bot.add_view(MusicControlView(self.bot), message_id=message_id)
+        # 봇이 로그인하기 전에 cog가 로드되므로 길드 목록이 준비된 뒤 패널 설정
+        task = self.loop.create_task(self.initialize_music_channels())
+        self.loading_tasks.add(task)
+        task.add_done_callback(self.loading_tasks.discard)
+        await self.music_manager.run_io(self.changelog.refresh)
+        await self.music_manager.load_audio_cache()
+        self.sampler_task = self.loop.create_task(self.system_sampler.run(self.music_manager.run_io))
+        self.reaper_task = self.loop.create_task(self.voice_reaper.run())
+        if self.loop_monitor:
+            self.loop_monitor_task = self.loop.create_task(self.loop_monitor.run())
+        if self.status_board:
+            self.status_task = self.loop.create_task(
+                self.status_board.run(self.collect_status, self.music_manager.run_io)
+            )
+
+    async def cog_unload(self):
+        if self.sampler_task:
+            self.sampler_task.cancel()
+        if self.reaper_task:
+            self.reaper_task.cancel()
+        if self.loop_monitor_task:
+            self.loop_monitor_task.cancel()
+            self.loop_monitor.stop()
+        if self.status_task:
+            self.status_task.cancel()
+            self.status_board.remove()
+        self.music_manager.close()
 
     async def initialize_music_channels(self):
-        """초기 음악 채널 설정 및 컨트롤 패널 초기화"""
-        for guild in self.bot.guilds:
-            try:
-                music_channel = discord.utils.get(
-                    guild.text_channels,
-                    name=self.config.MUSIC_CHANNEL_NAME
-                )
-                if music_channel:
-                    print(f"Found existing music channel in {guild.name}")
-                    await self.setup_control_panel(music_channel)
-            except Exception as e:
-                print(f"Error initializing music channel in {guild.name}: {e}")
-
-    async def setup_control_panel(self, channel: discord.TextChannel):
-        """음악 컨트롤 패널 설정"""
-        try:
-            # 기존 메시지 삭제
-            await channel.purge()
-            # 새 컨트롤 패널 생성
-            embed = await MusicEmbeds.create_control_panel_embed()
-            view = MusicControlView(self.bot)
-            await channel.send(embed=embed, view=view)
-        except Exception as e:
-            print(f"Error setting up control panel: {e}")
+        """초기 음악 채널 설정 및 컨트롤 패널 초기화
+
+        길드별 패널 설정을 동시에 진행하되, 세마포어로 동시 요청 수를 제한한다.
+        채널별 요청 한도(버킷)와 429 재시도는 discord.py HTTP 클라이언트가 처리한다.
+        """
+        await self.bot.wait_until_ready()
+        started = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.config.PANEL_SETUP_CONCURRENCY)
+
+        async def setup(guild: discord.Guild) -> Optional[str]:
+            music_channel = discord.utils.get(guild.text_channels, name=self.config.MUSIC_CHANNEL_NAME)
+            if not music_channel:
+                return None
+            stored = self.panel_store.get(guild.id)
+            async with semaphore:
+                try:
+                    # 저장된 패널이 같은 채널에 아직 남아 있으면 cog_load에서 이미 뷰를 연결했으므로 추가 작업 없음
+                    if stored and stored[0] == music_channel.id:
+                        try:
+                            await music_channel.fetch_message(stored[1])
+                            return 'reattached'
+                        except discord.NotFound:
+                            # 봇이 꺼져 있는 동안 삭제된 패널은 새로 설정
+                            self.panel_store.remove(guild.id)
+                    return await self.setup_control_panel(music_channel)
+                except Exception as e:
+                    logger.warning("Error initializing music channel", guild_id=guild.id, error=e)
+                    return 'failed'
+
+        results = await asyncio.gather(*(setup(guild) for guild in self.bot.guilds))
+        await self.music_manager.run_io(self.panel_store.save)
+        elapsed = time.perf_counter() - started
+        logger.info(
+            "Control panels ready",
+            latency=elapsed,
+            guilds=len(self.bot.guilds),
+            reattached=results.count('reattached'),
+            edited=results.count('edited'),
+            created=results.count('created'),
+            failed=results.count('failed')
+        )
+
+    async def setup_control_panel(self, channel: discord.TextChannel) -> str:
+        """음악 컨트롤 패널 설정 (마지막 메시지가 기존 패널이면 수정, 아니면 새로 전송)
+
+        패널 위치를 저장해 두므로 채널 기록 조회는 저장된 패널이 없을 때만 일어난다.
+        """
+        embed = await MusicEmbeds.create_control_panel_embed()
+        view = MusicControlView(self.bot)
+
+        last_message = None
+        async for message in channel.history(limit=1):
+            last_message = message
+
+        if last_message and last_message.author == self.bot.user:
+            message = await last_message.edit(embed=embed, view=view)
+            status = 'edited'
+        else:
+            message = await channel.send(embed=embed, view=view)
+            status = 'created'
+
+        self.panel_store.set(channel.guild.id, channel.id, message.id)
+        return status
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        """패널 메시지가 삭제되면 저장된 위치도 제거 (다음 시작 때 새로 설정)"""
+        stored = self.panel_store.get(payload.guild_id) if payload.guild_id else None
+        if stored and stored[1] == payload.message_id:
+            self.panel_store.remove(payload.guild_id)
+            await self.music_manager.run_io(self.panel_store.save)
 
     @app_commands.command(name='play', description='YouTube URL 또는 검색어로 음악을 재생합니다')
     @app_commands.describe(query='재생할 노래의 제목이나 URL을 입력하세요')
@@ -67,33 +183,89 @@ class MusicBot(commands.Cog):
             if not await self.ensure_voice_connected(interaction):
                 return
 
-            # 대기열 초기화
             guild_id = interaction.guild_id
-            if guild_id not in self.music_manager.queue:
-                self.music_manager.queue[guild_id] = []
+            self.notify_channels[guild_id] = interaction.channel_id
 
-            # 음악 추가 및 재생
-            sources = await self.music_manager.process_query(query, self.loop)
-            if not sources:
+            # 첫 곡이 준비되는 즉시 대기열에 추가하고 재생 시작
+            tracks = self.music_manager.stream_query(query, self.loop, guild_id)
+            first_track = await anext(tracks, None)
+            if first_track is None:
                 await interaction.followup.send("음악을 찾을 수 없습니다.")
                 return
 
-            # 대기열에 추가
-            self.music_manager.queue[guild_id].extend(sources)
-
-            # 현재 재생 중이 아니면 재생 시작
+            self.music_manager.add_to_queue(guild_id, first_track, self.loop)
             if not interaction.guild.voice_client.is_playing():
                 await self.play_next(interaction)
 
-            # 대기열 추가 메시지 전송
-            await self.send_queue_update(interaction, len(sources))
+            # 나머지 곡은 백그라운드에서 계속 불러오기
+            task = self.loop.create_task(self.load_remaining_tracks(interaction, tracks))
+            self.loading_tasks.add(task)
+            task.add_done_callback(self.loading_tasks.discard)
 
         except VoiceConnectionError as e:
             await interaction.followup.send(str(e))
-        except Exception as e:
-            print(f"Error in play_music: {e}")
+        except Exception:
+            logger.exception("Error in play_music", guild_id=interaction.guild_id, query=query)
             await interaction.followup.send("음악 재생 중 오류가 발생했습니다.")
 
+    async def load_remaining_tracks(self, interaction: discord.Interaction, tracks: AsyncIterator[Track]):
+        """재생목록의 나머지 곡을 대기열에 추가하면서 진행 상황을 주기적으로 갱신"""
+        guild_id = interaction.guild_id
+        added = 1
+        progress_message: Optional[discord.WebhookMessage] = None
+        progress_task: Optional[asyncio.Task] = None
+        last_update = time.monotonic()
+
+        try:
+            async for track in tracks:
+                # 불러오는 도중 /stop 등으로 음성 채널에서 나갔으면 중단
+                voice_client = interaction.guild.voice_client
+                if not voice_client:
+                    return
+
+                self.music_manager.add_to_queue(guild_id, track, self.loop)
+                added += 1
+
+                # 앞 곡이 먼저 끝나 재생이 멈춰 있으면 다시 시작
+                if not voice_client.is_playing() and not voice_client.is_paused():
+                    await self.play_next(interaction)
+
+                # 진행 상황 메시지는 일정 간격으로만 갱신하고, 이전 갱신이 끝나지 않았으면 건너뜀
+                now = time.monotonic()
+                if now - last_update < self.config.PROGRESS_UPDATE_INTERVAL:
+                    continue
+                if progress_task and not progress_task.done():
+                    continue
+                last_update = now
+                text = f"재생목록을 불러오는 중입니다... ({added}곡 추가됨)"
+                if progress_message is None:
+                    progress_message = await interaction.followup.send(text, wait=True)
+                else:
+                    progress_task = self.loop.create_task(progress_message.edit(content=text))
+
+            if progress_task and not progress_task.done():
+                await progress_task
+            if progress_message:
+                await progress_message.edit(content=f"재생목록에 {added}개의 곡이 추가되었습니다.")
+            else:
+                await self.send_queue_update(interaction, added)
+
+        except Exception:
+            logger.exception("Error loading remaining tracks", guild_id=guild_id, added=added)
+            await interaction.followup.send(f"재생목록을 불러오는 중 오류가 발생했습니다. ({added}곡 추가됨)")
+        finally:
+            await tracks.aclose()
+
+    async def send_queue_update(self, interaction: discord.Interaction, count: int):
+        """대기열 추가 메시지 전송"""
+        queue_length = self.music_manager.get_queue_length(interaction.guild_id)
+        if count == 1 and queue_length == 0:
+            # 추가한 곡이 바로 재생되었으면 재생 중 메시지로 충분
+            return
+        await interaction.followup.send(
+            f"대기열에 {count}개의 곡이 추가되었습니다. (대기 중인 곡: {queue_length}개)"
+        )
+
     async def ensure_voice_connected(self, interaction: discord.Interaction) -> bool:
         """음성 채널 연결 상태 확인 및 연결"""
         if not interaction.guild.voice_client:
@@ -107,58 +279,167 @@ class MusicBot(commands.Cog):
                 raise VoiceConnectionError("음성 채널에 먼저 입장해주세요!")
         return True
 
-    async def play_next(self, interaction: discord.Interaction):
-        """다음 곡 재생"""
+    async def play_next(self, interaction: discord.Interaction, ended_at: Optional[float] = None):
+        """다음 곡 재생
+
+        ended_at은 이전 곡이 끝난 시각(perf_counter)으로, 곡 전환 공백 측정에 사용한다.
+        """
         guild_id = interaction.guild_id
-        if not self.music_manager.queue[guild_id]:
-            await self.handle_empty_queue(interaction)
+        voice_client = interaction.guild.voice_client
+        if not voice_client:
+            # 재생 중에 연결이 끊겼으면 끝난 곡을 재생 중으로 남겨 두지 않음
+            self.music_manager.clear_current(guild_id)
             return
 
+        queue = self.music_manager.get_queue(guild_id)
+        source = None
+        lock = self.play_locks.setdefault(guild_id, asyncio.Lock())
         try:
-            # 다음 곡 가져오기
-            source = self.music_manager.queue[guild_id].pop(0)
-            self.music_manager.current[guild_id] = source
-
-            # 재생 시작
-            interaction.guild.voice_client.play(
-                source,
-                after=lambda e: asyncio.run_coroutine_threadsafe(
-                    self.handle_playback_error(interaction, e),
-                    self.loop
-                )
-            )
+            async with lock:
+                # 다른 경로(재생 종료 콜백, 재생목록 로딩)에서 이미 재생을 시작했으면 중복 재생하지 않음
+                if voice_client.is_playing() or voice_client.is_paused():
+                    return
+
+                # 다음 곡 가져오기 (미리 준비된 소스가 없으면 재생 직전에 생성)
+                while queue and source is None:
+                    track = queue.popleft()
+                    try:
+                        source = await self.music_manager.get_audio_source(guild_id, track, self.loop)
+                    except FFmpegLimitError:
+                        # 서버 전체 FFmpeg 한도에 걸렸으면 곡을 버리지 않고 대기열 맨 앞에 되돌림
+                        queue.insert(0, track)
+                        await interaction.followup.send(
+                            "지금은 재생 중인 서버가 많아 곡을 시작할 수 없습니다. 잠시 후 다시 시도해주세요."
+                        )
+                        return
+                    if source is None:
+                        await interaction.followup.send(f"'{track.title}' 곡을 재생할 수 없어 건너뜁니다.")
+
+                if source is None:
+                    self.music_manager.clear_current(guild_id)
+                else:
+                    self.music_manager.set_current(guild_id, source, track.position or 0.0)
+                    self.voice_reaper.cancel(guild_id, IDLE)
+
+                    # 재생 시작
+                    voice_client.play(
+                        self.music_manager.meter_source(guild_id, source),
+                        after=lambda e: asyncio.run_coroutine_threadsafe(
+                            self.handle_playback_error(interaction, e, time.perf_counter()),
+                            self.loop
+                        )
+                    )
+                    if ended_at is not None:
+                        self.music_manager.record_gap(guild_id, time.perf_counter() - ended_at)
+
+                    # 재생 중에 다음 곡 미리 준비
+                    self.music_manager.schedule_prefetch(guild_id, self.loop)
+                    self.music_manager.record_play(source, self.loop)
+
+            if source is None:
+                await self.handle_empty_queue(interaction)
+                return
 
             # 재생 중 메시지 전송
             embed = await MusicEmbeds.create_now_playing_embed(source)
             await interaction.followup.send(embed=embed)
 
-        except Exception as e:
-            print(f"Error in play_next: {e}")
+        except Exception:
+            logger.exception("Error in play_next", guild_id=guild_id)
             await interaction.followup.send("다음 곡 재생 중 오류가 발생했습니다.")
 
     async def handle_empty_queue(self, interaction: discord.Interaction):
-        """빈 대기열 처리"""
+        """빈 대기열 처리 (연결 종료는 voice_reaper에 예약하고 바로 반환)"""
+        self.voice_reaper.schedule(interaction.guild_id, IDLE, self.config.VOICE_IDLE_TIMEOUT)
         await interaction.followup.send(
-            "재생할 곡이 없습니다. 3분 내에 음악이 추가되지 않으면 자동으로 연결이 종료됩니다."
+            f"재생할 곡이 없습니다. {self._format_timeout(self.config.VOICE_IDLE_TIMEOUT)} 내에 "
+            f"음악이 추가되지 않으면 자동으로 연결이 종료됩니다."
         )
 
-        try:
-            await asyncio.sleep(180)  # 3분 대기
-            if (not self.music_manager.queue[interaction.guild_id] and
-                    interaction.guild.voice_client and
-                    not interaction.guild.voice_client.is_playing()):
-                await interaction.guild.voice_client.disconnect()
-                await interaction.followup.send("3분 동안 아무 곡도 추가되지 않아 연결을 종료합니다.")
-        except Exception as e:
-            print(f"Error in handle_empty_queue: {e}")
-
-    async def handle_playback_error(self, interaction: discord.Interaction, error):
+    @staticmethod
+    def _format_timeout(seconds: float) -> str:
+        seconds = int(seconds)
+        return f"{seconds // 60}분" if seconds % 60 == 0 else f"{seconds}초"
+
+    async def reap_voice_client(self, guild_id: int, reason: str):
+        """예약된 음성 연결 종료 (예약 후 다시 재생하거나 사람이 들어왔으면 유지)"""
+        guild = self.bot.get_guild(guild_id)
+        voice_client = guild.voice_client if guild else None
+        if not voice_client:
+            return
+
+        if reason == IDLE:
+            if (voice_client.is_playing() or voice_client.is_paused() or
+                    self.music_manager.get_queue_length(guild_id)):
+                return
+            message = (f"{self._format_timeout(self.config.VOICE_IDLE_TIMEOUT)} 동안 아무 곡도 추가되지 않아 "
+                       f"연결을 종료합니다.")
+        else:
+            if self._has_listeners(voice_client.channel):
+                return
+            message = "음성 채널에 아무도 없어 연결을 종료합니다."
+
+        logger.info("Disconnecting idle voice client", guild_id=guild_id, reason=reason)
+        # 연결을 끊으면 on_voice_state_update에서 안내 채널 기록도 지우므로 먼저 꺼내 둠
+        channel = self.bot.get_channel(self.notify_channels.pop(guild_id, 0))
+        self.music_manager.clear_queue(guild_id)
+        await voice_client.disconnect()
+        if channel:
+            await channel.send(message)
+
+    @staticmethod
+    def _has_listeners(channel: Optional[discord.VoiceChannel]) -> bool:
+        """봇을 제외한 사람이 음성 채널에 있는지 여부"""
+        return bool(channel) and any(not member.bot for member in channel.members)
+
+    def update_listeners(self, guild: discord.Guild):
+        """봇이 있는 음성 채널이 비었으면 연결 종료 예약, 사람이 있으면 취소"""
+        voice_client = guild.voice_client
+        if not voice_client:
+            return
+        if self._has_listeners(voice_client.channel):
+            self.voice_reaper.cancel(guild.id, EMPTY)
+        else:
+            self.voice_reaper.schedule(guild.id, EMPTY, self.config.VOICE_EMPTY_TIMEOUT)
+
+    async def handle_playback_error(self, interaction: discord.Interaction, error,
+                                    ended_at: Optional[float] = None):
         """재생 중 에러 처리"""
         if error:
-            print(f"Playback error: {error}")
+            logger.warning("Playback error", guild_id=interaction.guild_id, error=error)
+            self.music_manager.record_playback_error(interaction.guild_id)
             await interaction.followup.send("재생 중 오류가 발생했습니다.")
         else:
-            await self.play_next(interaction)
+            await self.play_next(interaction, ended_at)
+
+    @commands.Cog.listener()
+    async def on_voice_state_update(self, member: discord.Member, before: discord.VoiceState,
+                                    after: discord.VoiceState):
+        """음성 채널 입장/퇴장 처리
+
+        봇이 나가면(강제 퇴장 포함) 현재 곡 정보, 재생 지표, 남은 FFmpeg 프로세스와 연결 종료 예약을 정리하고,
+        봇이 있는 채널에 사람이 드나들면 빈 채널 연결 종료를 예약하거나 취소한다.
+        """
+        if before.channel == after.channel:
+            # 음소거 등 채널 이동이 아닌 변경
+            return
+
+        guild = member.guild
+        if member.id == self.bot.user.id:
+            if before.channel and not after.channel:
+                # 현재 곡을 비우지 않으면 대기열 저장소가 계속 재생 중으로 보고 재생 위치를 늘려 기록함
+                self.music_manager.clear_current(guild.id)
+                self.music_manager.release_guild_processes(guild.id)
+                self.music_manager.release_playback_stats(guild.id)
+                self.voice_reaper.cancel(guild.id)
+                self.notify_channels.pop(guild.id, None)
+            else:
+                self.update_listeners(guild)
+            return
+
+        voice_client = guild.voice_client
+        if voice_client and voice_client.channel in (before.channel, after.channel):
+            self.update_listeners(guild)
 
     @app_commands.command(name='skip', description='현재 재생 중인 곡을 건너뜁니다')
     async def skip(self, interaction: discord.Interaction):
@@ -172,19 +453,23 @@ class MusicBot(commands.Cog):
     @app_commands.command(name='queue', description='재생 대기열을 확인합니다')
     async def queue(self, interaction: discord.Interaction):
         """대기열 표시"""
+        await self.show_queue(interaction)
+
+    async def show_queue(self, interaction: discord.Interaction):
+        """대기열 표시 (명령어와 컨트롤 패널 버튼에서 공용)"""
         guild_id = interaction.guild_id
-        if guild_id not in self.music_manager.queue or not self.music_manager.queue[guild_id]:
+        if not self.music_manager.get_queue_length(guild_id):
             await interaction.response.send_message("재생 대기열이 비어있습니다.", ephemeral=True)
             return
 
         try:
             embed = await MusicEmbeds.create_queue_embed(
-                self.music_manager.queue[guild_id],
+                self.music_manager.get_queue(guild_id),
                 self.music_manager.current.get(guild_id)
             )
             await interaction.response.send_message(embed=embed)
-        except Exception as e:
-            print(f"Error showing queue: {e}")
+        except Exception:
+            logger.exception("Error showing queue", guild_id=guild_id)
             await interaction.response.send_message("대기열을 표시하는 중 오류가 발생했습니다.", ephemeral=True)
 
     @app_commands.command(name='pause', description='현재 재생 중인 음악을 일시정지합니다')
@@ -209,14 +494,95 @@ class MusicBot(commands.Cog):
     async def stop(self, interaction: discord.Interaction):
         """재생 중지 및 대기열 초기화"""
         guild_id = interaction.guild_id
-        if guild_id in self.music_manager.queue:
-            self.music_manager.queue[guild_id].clear()
+        self.music_manager.clear_queue(guild_id)
         if interaction.guild.voice_client:
             await interaction.guild.voice_client.disconnect()
             await interaction.response.send_message("재생을 중지하고 대기열을 초기화했습니다.")
         else:
             await interaction.response.send_message("이미 음성 채널에서 나와있습니다.", ephemeral=True)
 
+    @app_commands.command(name='stats', description='재생 품질과 캐시 통계를 보여줍니다')
+    async def stats(self, interaction: discord.Interaction):
+        """재생 파이프라인 통계 표시"""
+        # FFmpeg 프로세스별 /proc 조회는 입출력 스레드에서
+        ffmpeg_stats = await self.music_manager.run_io(self.music_manager.get_ffmpeg_stats)
+        embed = await MusicEmbeds.create_stats_embed(
+            self.music_manager.get_playback_stats(interaction.guild_id).summary(),
+            self.music_manager.get_gap_stats(),
+            self.music_manager.get_cache_stats(),
+            ffmpeg_stats,
+            self.music_manager.get_executor_stats()
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @app_commands.command(name='lag', description='이벤트 루프 지연과 루프를 오래 막은 작업을 보여줍니다')
+    async def lag(self, interaction: discord.Interaction):
+        """이벤트 루프 지연 통계와 가장 오래 막은 위치 표시"""
+        if not self.loop_monitor:
+            await interaction.response.send_message("이벤트 루프 감시가 꺼져 있습니다.", ephemeral=True)
+            return
+        embed = await MusicEmbeds.create_loop_lag_embed(self.loop_monitor.summary(), self.loop_monitor.worst())
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    def collect_status(self) -> Dict[str, Any]:
+        """이 프로세스의 상태 (워커 상태 공유 및 /status용)"""
+        voice_clients = self.bot.voice_clients
+        # 프로세스별 메모리는 측정해 둔 최근 값 사용 (/proc 조회를 이벤트 루프에서 하지 않음)
+        sample = self.system_sampler.latest() or {}
+        latency = self.bot.latency
+        return {
+            'worker_id': self.config.WORKER_ID or 0,
+            'pid': os.getpid(),
+            'shard_ids': list(getattr(self.bot, 'shard_ids', None) or []),
+            'guilds': len(self.bot.guilds),
+            'voice_clients': len(voice_clients),
+            'playing': sum(1 for voice_client in voice_clients if voice_client.is_playing()),
+            'queued_tracks': sum(len(queue) for queue in self.music_manager.queue.values()),
+            'ffmpeg_processes': sample.get('ffmpeg_processes') or 0,
+            'ffmpeg_rss_bytes': sample.get('ffmpeg_rss_bytes') or 0,
+            'process_rss_bytes': sample.get('process_rss_bytes') or 0,
+            'latency_ms': latency * 1000 if math.isfinite(latency) else None,
+        }
+
+    @app_commands.command(name='status', description='봇 전체 상태를 보여줍니다')
+    async def status(self, interaction: discord.Interaction):
+        """봇 상태 표시 (워커 모드면 모든 워커 합산)"""
+        own = self.collect_status()
+        statuses = [own]
+        if self.status_board:
+            others = await self.music_manager.run_io(self.status_board.read_all)
+            statuses += [status for status in others if status.get('worker_id') != own['worker_id']]
+        embed = await MusicEmbeds.create_status_embed(
+            aggregate_status(statuses), statuses, self.system_sampler.summary()
+        )
+        await interaction.response.send_message(embed=embed)
+
+    @app_commands.command(name='version', description='현재 버전과 릴리즈노트를 확인합니다')
+    @app_commands.describe(version='확인할 버전 (비워두면 현재 버전)')
+    async def version(self, interaction: discord.Interaction, version: Optional[str] = None):
+        """버전 및 릴리즈 노트 표시 (색인에서 바로 조회)"""
+        if self.changelog.needs_check():
+            await self.music_manager.run_io(self.changelog.refresh)
+
+        release = self.changelog.get(version)
+        if version and release is None:
+            await interaction.response.send_message(f"{version} 버전을 찾을 수 없습니다.", ephemeral=True)
+            return
+        if not self.changelog.current_version:
+            await interaction.response.send_message("버전 정보를 찾을 수 없습니다.", ephemeral=True)
+            return
+
+        embed = await MusicEmbeds.create_version_embed(
+            release, self.changelog.current_version, self.changelog.repo_url
+        )
+        await interaction.response.send_message(embed=embed)
+
+    @version.autocomplete('version')
+    async def version_autocomplete(self, interaction: discord.Interaction,
+                                   current: str) -> List[app_commands.Choice[str]]:
+        return [app_commands.Choice(name=f"v{version}", value=version)
+                for version in self.changelog.search(current)]
+
     @app_commands.command(name='help', description='봇의 명령어 목록과 사용법을 보여줍니다')
     async def help(self, interaction: discord.Interaction):
         """도움말 표시"""
@@ -1,17 +1,64 @@
+import os
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from dotenv import load_dotenv
 
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 
 @dataclass
 class BotConfig:
     MUSIC_CHANNEL_NAME: str
     YTDLP_FORMAT_OPTIONS: Dict[str, Any]
     FFMPEG_OPTIONS: Dict[str, Any]
+    METADATA_CACHE_PATH: Optional[str]
+    METADATA_CACHE_SIZE: int
+    STREAM_URL_TTL: int
+    PLAYLIST_CONCURRENCY: int
+    YTDL_POOL_SIZE: int
+    SEARCH_CACHE_TTL: int
+    SEARCH_CACHE_PERSIST: bool
+    PREFETCH_COUNT: int
+    PREFETCH_WARMUP_LEAD: int
+    PROGRESS_UPDATE_INTERVAL: float
+    AUDIO_CACHE_ENABLED: bool
+    AUDIO_CACHE_DIR: str
+    AUDIO_CACHE_MAX_MB: int
+    AUDIO_CACHE_PLAY_THRESHOLD: int
+    PLAYBACK_MODE: str
+    PLAYBACK_VOLUME: float
+    FFMPEG_MAX_PROCESSES: int
+    PANEL_SETUP_CONCURRENCY: int
+    PANEL_STORE_PATH: str
+    QUEUE_STORE_PATH: str
+    QUEUE_STORE_FLUSH_INTERVAL: float
+    SEARCH_WORKERS: int
+    EXTRACT_WORKERS: int
+    DISK_IO_WORKERS: int
+    SYSTEM_SAMPLE_INTERVAL: float
+    LOOP_MONITOR_INTERVAL: float
+    LOOP_LAG_THRESHOLD: float
+    VOICE_IDLE_TIMEOUT: float
+    VOICE_EMPTY_TIMEOUT: float
+    VOICE_REAPER_INTERVAL: float
+    LOG_LEVEL: str
+    LOG_FORMAT: str
+    LOG_RATE_BURST: int
+    LOG_RATE_WINDOW: float
+    LAUNCH_MODE: str
+    WORKER_COUNT: int
+    SHARD_COUNT: Optional[int]
+    WORKER_ID: Optional[int]
+    STATUS_DIR: str
+    CHANGELOG_PATH: str
+    PACKAGE_JSON_PATH: str
 
     @classmethod
     def load_config(cls) -> 'BotConfig':
         load_dotenv()
+        # 워커 프로세스 모드에서는 런처가 워커마다 WORKER_ID를 지정
+        worker_id = int(os.environ['WORKER_ID']) if os.getenv('WORKER_ID') else None
+        shard_count = os.getenv('SHARD_COUNT')
         return cls(
             MUSIC_CHANNEL_NAME='우타의 노래방♪',
             YTDLP_FORMAT_OPTIONS={
@@ -37,5 +84,81 @@ class BotConfig:
             FFMPEG_OPTIONS={
                 'before_options': '-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5',
                 'options': '-vn'
-            }
+            },
+            METADATA_CACHE_PATH=worker_path(os.getenv('METADATA_CACHE_PATH', 'cache/metadata.json'), worker_id),
+            METADATA_CACHE_SIZE=int(os.getenv('METADATA_CACHE_SIZE', '2000')),
+            # googlevideo 스트림 URL은 약 6시간 후 만료된다
+            STREAM_URL_TTL=int(os.getenv('STREAM_URL_TTL', str(5 * 60 * 60))),
+            PLAYLIST_CONCURRENCY=int(os.getenv('PLAYLIST_CONCURRENCY', '8')),
+            YTDL_POOL_SIZE=int(os.getenv('YTDL_POOL_SIZE', '10')),
+            SEARCH_CACHE_TTL=int(os.getenv('SEARCH_CACHE_TTL', '3600')),
+            # 검색어 -> 영상 ID 매핑을 메타데이터 캐시 파일에도 저장할지 여부
+            SEARCH_CACHE_PERSIST=os.getenv('SEARCH_CACHE_PERSIST', 'true').lower() == 'true',
+            # 다음 N곡의 스트림 URL을 미리 확인하고, 현재 곡 종료 N초 전에 다음 곡 FFmpeg을 미리 띄운다
+            PREFETCH_COUNT=int(os.getenv('PREFETCH_COUNT', '2')),
+            PREFETCH_WARMUP_LEAD=int(os.getenv('PREFETCH_WARMUP_LEAD', '15')),
+            # 재생목록 로딩 진행 메시지 최소 갱신 간격 (초)
+            PROGRESS_UPDATE_INTERVAL=float(os.getenv('PROGRESS_UPDATE_INTERVAL', '3')),
+            # 자주 재생되는 곡을 로컬 Opus 파일로 저장 (기본 비활성화)
+            AUDIO_CACHE_ENABLED=os.getenv('AUDIO_CACHE_ENABLED', 'false').lower() == 'true',
+            AUDIO_CACHE_DIR=worker_path(os.getenv('AUDIO_CACHE_DIR', 'cache/audio'), worker_id),
+            AUDIO_CACHE_MAX_MB=int(os.getenv('AUDIO_CACHE_MAX_MB', '2048')),
+            AUDIO_CACHE_PLAY_THRESHOLD=int(os.getenv('AUDIO_CACHE_PLAY_THRESHOLD', '3')),
+            # pcm: FFmpeg PCM 디코딩 후 파이썬에서 볼륨 조절, discord.py가 Opus 인코딩
+            # opus: FFmpeg이 Opus 패킷을 직접 생성 (볼륨 1.0 + Opus 원본이면 복사, 아니면 libopus 재인코딩)
+            # auto: 복사할 수 있을 때만 opus, 나머지는 pcm (FFmpeg libopus 재인코딩은 pcm보다 CPU를 약 3배 사용)
+            PLAYBACK_MODE=os.getenv('PLAYBACK_MODE', 'auto'),
+            PLAYBACK_VOLUME=float(os.getenv('PLAYBACK_VOLUME', '0.5')),
+            # 동시에 실행할 수 있는 재생용 FFmpeg 프로세스 수 (미리 준비한 다음 곡 포함)
+            FFMPEG_MAX_PROCESSES=int(os.getenv('FFMPEG_MAX_PROCESSES', '64')),
+            # 시작 시 동시에 설정할 컨트롤 패널 수 (전역 API 요청 한도를 넘지 않도록 제한)
+            PANEL_SETUP_CONCURRENCY=int(os.getenv('PANEL_SETUP_CONCURRENCY', '5')),
+            # 길드별 컨트롤 패널 메시지 위치 저장 파일
+            PANEL_STORE_PATH=worker_path(os.getenv('PANEL_STORE_PATH', 'cache/panels.json'), worker_id),
+            # 재시작 후 복원할 대기열 저장 DB, 변경 사항을 모아서 기록하는 간격 (초)
+            QUEUE_STORE_PATH=os.getenv('QUEUE_STORE_PATH', 'cache/queues.sqlite3'),
+            QUEUE_STORE_FLUSH_INTERVAL=float(os.getenv('QUEUE_STORE_FLUSH_INTERVAL', '2')),
+            # 작업 종류별 전용 스레드 수 (검색 / 영상 정보 추출 / 디스크 입출력)
+            SEARCH_WORKERS=int(os.getenv('SEARCH_WORKERS', '4')),
+            EXTRACT_WORKERS=int(os.getenv('EXTRACT_WORKERS', '8')),
+            DISK_IO_WORKERS=int(os.getenv('DISK_IO_WORKERS', '2')),
+            # CPU/메모리 사용량 측정 간격 (초, 최근 5분치 보관)
+            SYSTEM_SAMPLE_INTERVAL=float(os.getenv('SYSTEM_SAMPLE_INTERVAL', '5')),
+            # 이벤트 루프 지연 측정 간격, 이 시간(초) 넘게 루프를 막은 작업은 스택을 기록 (0이면 비활성화)
+            LOOP_MONITOR_INTERVAL=float(os.getenv('LOOP_MONITOR_INTERVAL', '0.5')),
+            LOOP_LAG_THRESHOLD=float(os.getenv('LOOP_LAG_THRESHOLD', '0.25')),
+            # 재생할 곡이 없을 때 / 음성 채널에 사람이 없을 때 연결을 끊기까지 기다리는 시간 (초)
+            VOICE_IDLE_TIMEOUT=float(os.getenv('VOICE_IDLE_TIMEOUT', '180')),
+            VOICE_EMPTY_TIMEOUT=float(os.getenv('VOICE_EMPTY_TIMEOUT', '60')),
+            # 연결 종료 예약 확인 간격 (초)
+            VOICE_REAPER_INTERVAL=float(os.getenv('VOICE_REAPER_INTERVAL', '5')),
+            # 로그 레벨과 형식 (text: key=value, json: 한 줄 JSON)
+            LOG_LEVEL=os.getenv('LOG_LEVEL', 'INFO'),
+            LOG_FORMAT=os.getenv('LOG_FORMAT', 'text'),
+            # 같은 메시지는 LOG_RATE_WINDOW초에 LOG_RATE_BURST번까지만 기록 (0이면 제한 없음)
+            LOG_RATE_BURST=int(os.getenv('LOG_RATE_BURST', '5')),
+            LOG_RATE_WINDOW=float(os.getenv('LOG_RATE_WINDOW', '10')),
+            # single: 샤딩 없이 한 프로세스, autoshard: 한 프로세스에서 AutoShardedBot,
+            # workers: WORKER_COUNT개 프로세스가 샤드를 나눠 맡음 (SHARD_COUNT 미지정 시 워커 수와 같게)
+            LAUNCH_MODE=os.getenv('LAUNCH_MODE', 'single'),
+            WORKER_COUNT=int(os.getenv('WORKER_COUNT', '1')),
+            SHARD_COUNT=int(shard_count) if shard_count else None,
+            WORKER_ID=worker_id,
+            # 워커 상태 공유 디렉터리 (/status 합산용)
+            STATUS_DIR=os.getenv('STATUS_DIR', 'cache/status'),
+            # /version에서 사용하는 릴리즈 노트와 버전 정보 파일 (standard-version이 생성)
+            CHANGELOG_PATH=os.getenv('CHANGELOG_PATH', os.path.join(PROJECT_ROOT, 'CHANGELOG.md')),
+            PACKAGE_JSON_PATH=os.getenv('PACKAGE_JSON_PATH', os.path.join(PROJECT_ROOT, 'package.json'))
         )
+
+
+def worker_path(path: Optional[str], worker_id: Optional[int]) -> Optional[str]:
+    """워커별로 따로 쓰는 파일 경로 (cache/metadata.json -> cache/metadata.worker0.json)
+
+    JSON 캐시처럼 파일 전체를 덮어쓰는 저장소는 워커끼리 공유하면 서로의 내용을 지우므로 나눈다.
+    SQLite 대기열 저장소는 길드별 행 단위로 기록하므로 공유한다.
+    """
+    if not path or worker_id is None:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}.worker{worker_id}{ext}"
@@ -1,20 +1,126 @@
 import asyncio
+import multiprocessing
 import os
+import time
+from typing import List, Optional
+
+import discord
 from discord.ext import commands
+
+from config.bot_config import BotConfig
 from cogs.music_bot import MusicBot
+from utils.log import get_logger, setup_logging
+
+logger = get_logger(__name__)
 
+# 같은 봇의 샤드 접속(IDENTIFY)은 5초에 한 번으로 제한되므로 워커 시작 간격을 둔다
+WORKER_START_INTERVAL = 5.0
+WORKER_RESTART_DELAY = 10.0
 
-async def main():
+
+def create_bot(config: BotConfig, shard_ids: Optional[List[int]] = None,
+               shard_count: Optional[int] = None) -> commands.Bot:
+    """실행 모드에 맞는 봇 생성 (single이 아니면 AutoShardedBot)"""
     intents = discord.Intents.default()
     intents.message_content = True
     intents.voice_states = True
 
-    bot = commands.Bot(command_prefix='!', intents=intents)
+    if config.LAUNCH_MODE == 'single':
+        return commands.Bot(command_prefix='!', intents=intents)
+    return commands.AutoShardedBot(
+        command_prefix='!',
+        intents=intents,
+        shard_ids=shard_ids,
+        shard_count=shard_count
+    )
+
+
+def configure_logging(config: BotConfig):
+    """설정에 맞춰 대기열 기반 로깅 시작 (프로세스마다 한 번)"""
+    setup_logging(config.LOG_LEVEL, config.LOG_FORMAT == 'json', config.LOG_RATE_BURST, config.LOG_RATE_WINDOW)
+
+
+async def run_bot(shard_ids: Optional[List[int]] = None, shard_count: Optional[int] = None):
+    config = BotConfig.load_config()
+    configure_logging(config)
+    bot = create_bot(config, shard_ids, shard_count)
     await bot.add_cog(MusicBot(bot))
 
     token = os.getenv("DISCORD_BOT_TOKEN")
     await bot.start(token)
 
 
+def run_worker(worker_id: int, shard_ids: List[int], shard_count: int):
+    """워커 프로세스 진입점 (워커별 저장 파일과 상태 파일은 WORKER_ID로 구분)"""
+    os.environ['WORKER_ID'] = str(worker_id)
+    configure_logging(BotConfig.load_config())
+    logger.info("Worker starting", worker_id=worker_id, pid=os.getpid(),
+                shard_ids=shard_ids, shard_count=shard_count)
+    asyncio.run(run_bot(shard_ids, shard_count))
+
+
+def split_shards(shard_count: int, worker_count: int) -> List[List[int]]:
+    """샤드를 워커 수만큼 연속 구간으로 나눔"""
+    worker_count = max(1, min(worker_count, shard_count))
+    base, extra = divmod(shard_count, worker_count)
+    ranges, start = [], 0
+    for i in range(worker_count):
+        end = start + base + (1 if i < extra else 0)
+        ranges.append(list(range(start, end)))
+        start = end
+    return ranges
+
+
+def run_workers(config: BotConfig):
+    """샤드 구간별 워커 프로세스를 띄우고, 비정상 종료된 워커는 다시 시작"""
+    shard_count = config.SHARD_COUNT or config.WORKER_COUNT
+    assignments = split_shards(shard_count, config.WORKER_COUNT)
+    context = multiprocessing.get_context('spawn')
+    processes = {}
+
+    def start(worker_id: int):
+        process = context.Process(
+            target=run_worker,
+            args=(worker_id, assignments[worker_id], shard_count),
+            name=f'bot-worker-{worker_id}'
+        )
+        process.start()
+        processes[worker_id] = process
+
+    try:
+        for worker_id in range(len(assignments)):
+            if worker_id:
+                time.sleep(WORKER_START_INTERVAL)
+            start(worker_id)
+
+        while processes:
+            time.sleep(WORKER_RESTART_DELAY)
+            for worker_id, process in list(processes.items()):
+                if process.is_alive():
+                    continue
+                if process.exitcode == 0:
+                    del processes[worker_id]
+                    continue
+                logger.warning("Worker exited, restarting", worker_id=worker_id, exitcode=process.exitcode)
+                start(worker_id)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for process in processes.values():
+            if process.is_alive():
+                process.terminate()
+        for process in processes.values():
+            process.join()
+
+
+def main():
+    config = BotConfig.load_config()
+    configure_logging(config)
+    if config.LAUNCH_MODE == 'workers':
+        run_workers(config)
+    else:
+        asyncio.run(run_bot(shard_count=config.SHARD_COUNT))
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    main()
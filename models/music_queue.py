@@ -0,0 +1,235 @@
+import random
+from collections import deque
+from itertools import islice
+from typing import Deque, Iterable, Iterator, List, Optional, Tuple, Union
+
+from models.music_source import Track
+
+
+class _DurationNode:
+    """_DurationTree의 노드 (곡 하나의 재생 시간과 하위 트리 합계)"""
+    __slots__ = ('duration', 'unknown', 'priority', 'left', 'right', 'size', 'total', 'unknown_total')
+
+    def __init__(self, track: Track):
+        self.duration = track.duration or 0
+        self.unknown = 0 if track.duration else 1
+        self.priority = random.random()
+        self.left: Optional['_DurationNode'] = None
+        self.right: Optional['_DurationNode'] = None
+        self.size = 1
+        self.total = self.duration
+        self.unknown_total = self.unknown
+
+    def update(self):
+        left, right = self.left, self.right
+        self.size = 1 + (left.size if left else 0) + (right.size if right else 0)
+        self.total = self.duration + (left.total if left else 0) + (right.total if right else 0)
+        self.unknown_total = self.unknown + (left.unknown_total if left else 0) + (right.unknown_total if right else 0)
+
+
+class _DurationTree:
+    """위치(순서)를 키로 하는 트립(treap)으로 앞에서부터의 재생 시간 합을 유지
+
+    노드마다 하위 트리의 곡 수와 재생 시간 합을 들고 있어, 위치 기준 삽입/삭제와
+    "앞에서 n곡의 재생 시간 합" 조회가 모두 O(log n)이다 (기댓값).
+    """
+
+    def __init__(self, tracks: Iterable[Track] = ()):
+        self.root = self._build(tracks)
+
+    @staticmethod
+    def _build(tracks: Iterable[Track]) -> Optional[_DurationNode]:
+        """순서대로 O(n)에 트리 구성 (오른쪽 경로를 스택으로 유지하는 카르테시안 트리 생성)"""
+        stack: List[_DurationNode] = []
+        for track in tracks:
+            node = _DurationNode(track)
+            last = None
+            while stack and stack[-1].priority < node.priority:
+                last = stack.pop()
+                last.update()
+            node.left = last
+            if stack:
+                stack[-1].right = node
+            stack.append(node)
+        root = stack[0] if stack else None
+        while stack:
+            stack.pop().update()
+        return root
+
+    @classmethod
+    def _split(cls, node: Optional[_DurationNode],
+               count: int) -> Tuple[Optional[_DurationNode], Optional[_DurationNode]]:
+        """앞의 count개와 나머지로 분리"""
+        if node is None:
+            return None, None
+        left_size = node.left.size if node.left else 0
+        if count <= left_size:
+            first, node.left = cls._split(node.left, count)
+            node.update()
+            return first, node
+        node.right, rest = cls._split(node.right, count - left_size - 1)
+        node.update()
+        return node, rest
+
+    @classmethod
+    def _merge(cls, first: Optional[_DurationNode], second: Optional[_DurationNode]) -> Optional[_DurationNode]:
+        if first is None:
+            return second
+        if second is None:
+            return first
+        if first.priority > second.priority:
+            first.right = cls._merge(first.right, second)
+            first.update()
+            return first
+        second.left = cls._merge(first, second.left)
+        second.update()
+        return second
+
+    def insert(self, index: int, track: Track):
+        first, rest = self._split(self.root, index)
+        self.root = self._merge(self._merge(first, _DurationNode(track)), rest)
+
+    def append(self, track: Track):
+        self.root = self._merge(self.root, _DurationNode(track))
+
+    def pop(self, index: int):
+        first, rest = self._split(self.root, index)
+        _, rest = self._split(rest, 1)
+        self.root = self._merge(first, rest)
+
+    def prefix(self, count: int) -> Tuple[int, int]:
+        """앞에서 count곡의 (재생 시간 합, 길이 정보 없는 곡 수)"""
+        known = unknown = 0
+        node = self.root
+        while node is not None and count > 0:
+            left = node.left
+            left_size = left.size if left else 0
+            if count <= left_size:
+                node = left
+                continue
+            if left:
+                known += left.total
+                unknown += left.unknown_total
+            known += node.duration
+            unknown += node.unknown
+            count -= left_size + 1
+            node = node.right
+        return known, unknown
+
+
+class MusicQueue:
+    """길드별 재생 대기열
+
+    deque 기반으로 앞에서 꺼내기/뒤에 추가는 O(1), 중간 삽입/삭제는 가까운 끝에서부터 처리한다.
+    남은 재생 시간 합계와 길이 정보가 없는 곡 수는 변경 시마다 갱신해 둔다.
+
+    위치별 대기 시간 계산을 위해 같은 순서로 재생 시간 트리(_DurationTree)를 함께 유지한다.
+    추가/꺼내기/삽입/삭제/이동은 트리도 O(log n)에 갱신하므로 어떤 변경 뒤에도 위치별 조회는 O(log n)이고,
+    순서 전체가 바뀌는 섞기만 트리를 O(n)에 다시 만든다.
+    """
+
+    def __init__(self, tracks: Optional[Iterable[Track]] = None):
+        self._tracks: Deque[Track] = deque()
+        self.total_duration = 0
+        self.unknown_duration_count = 0
+        self._durations = _DurationTree()
+        if tracks:
+            self.extend(tracks)
+
+    def _on_added(self, track: Track):
+        if track.duration:
+            self.total_duration += track.duration
+        else:
+            self.unknown_duration_count += 1
+
+    def _on_removed(self, track: Track):
+        if track.duration:
+            self.total_duration -= track.duration
+        else:
+            self.unknown_duration_count -= 1
+
+    def duration_before(self, position: int) -> Tuple[int, int]:
+        """position 위치의 곡이 시작되기 전까지의 (재생 시간 합, 길이 정보 없는 곡 수)"""
+        return self._durations.prefix(max(0, min(position, len(self._tracks))))
+
+    def append(self, track: Track):
+        """대기열 끝에 추가"""
+        self._tracks.append(track)
+        self._on_added(track)
+        self._durations.append(track)
+
+    def extend(self, tracks: Iterable[Track]):
+        """여러 곡을 대기열 끝에 추가"""
+        for track in tracks:
+            self.append(track)
+
+    def popleft(self) -> Track:
+        """맨 앞 곡 꺼내기"""
+        track = self._tracks.popleft()
+        self._on_removed(track)
+        self._durations.pop(0)
+        return track
+
+    def peek(self) -> Optional[Track]:
+        """맨 앞 곡 확인"""
+        return self._tracks[0] if self._tracks else None
+
+    def insert(self, index: int, track: Track):
+        """특정 위치에 삽입"""
+        if index >= len(self._tracks):
+            self.append(track)
+            return
+        if index < 0:
+            index = max(0, index + len(self._tracks))
+        self._tracks.insert(index, track)
+        self._on_added(track)
+        self._durations.insert(index, track)
+
+    def remove_at(self, index: int) -> Track:
+        """특정 위치의 곡 제거"""
+        if index < 0:
+            index += len(self._tracks)
+        track = self._tracks[index]
+        del self._tracks[index]
+        self._on_removed(track)
+        self._durations.pop(index)
+        return track
+
+    def move(self, source: int, destination: int):
+        """곡 위치 이동"""
+        track = self._tracks[source]
+        del self._tracks[source]
+        self._tracks.insert(destination, track)
+        self._durations.pop(source)
+        self._durations.insert(destination, track)
+
+    def shuffle(self):
+        """대기열 섞기"""
+        tracks = list(self._tracks)
+        random.shuffle(tracks)
+        self._tracks = deque(tracks)
+        self._durations = _DurationTree(tracks)
+
+    def clear(self):
+        """대기열 초기화"""
+        self._tracks.clear()
+        self.total_duration = 0
+        self.unknown_duration_count = 0
+        self._durations = _DurationTree()
+
+    def __len__(self) -> int:
+        return len(self._tracks)
+
+    def __bool__(self) -> bool:
+        return bool(self._tracks)
+
+    def __iter__(self) -> Iterator[Track]:
+        return iter(self._tracks)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Track, List[Track]]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self._tracks))
+            if step < 0:
+                return list(self._tracks)[index]
+            return list(islice(self._tracks, start, stop, step))
+        return self._tracks[index]
@@ -1,12 +1,153 @@
 import discord
-from typing import Optional
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Union
 
-class YTDLPSource(discord.PCMVolumeTransformer):
-    def __init__(self, source: discord.AudioSource, *, data: dict, volume: float = 0.5):
-        super().__init__(source, volume)
+from utils.audio import GainStage
+
+
+@dataclass
+class Track:
+    """대기열에 보관하는 곡 정보 (오디오 소스와 스트림 URL은 재생 직전에 준비)"""
+    title: str
+    webpage_url: str
+    video_id: Optional[str] = None
+    duration: Optional[int] = None
+    thumbnail: Optional[str] = None
+    # 이어서 재생할 위치 (초, 재시작 전에 재생 중이던 곡 복원 시 사용)
+    position: Optional[float] = None
+
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> Optional['Track']:
+        """yt-dlp 추출 결과(플랫 항목 포함)로 Track 생성"""
+        webpage_url = data.get('webpage_url')
+        if not webpage_url and data.get('_type') == 'url':
+            webpage_url = data.get('url')
+        if not webpage_url:
+            return None
+
+        thumbnail = data.get('thumbnail')
+        if not thumbnail and data.get('thumbnails'):
+            thumbnail = data['thumbnails'][-1].get('url')
+
+        return cls(
+            title=data.get('title') or 'No title',
+            webpage_url=webpage_url,
+            video_id=data.get('id'),
+            duration=data.get('duration'),
+            thumbnail=thumbnail
+        )
+
+    def to_data(self) -> Dict[str, Any]:
+        """yt-dlp 추출 결과와 같은 키를 가진 dict로 변환"""
+        return {
+            'id': self.video_id,
+            'title': self.title,
+            'webpage_url': self.webpage_url,
+            'duration': self.duration,
+            'thumbnail': self.thumbnail,
+        }
+
+
+class TrackInfoMixin:
+    """재생 소스에 곡 정보 속성 부여"""
+    def _init_track_info(self, data: dict):
         self.data: dict = data
         self.title: str = data.get('title', 'No title')
         self.url: str = data.get('url', '')
         self.duration: Optional[int] = data.get('duration')
         self.thumbnail: Optional[str] = data.get('thumbnail')
-        self.webpage_url: Optional[str] = data.get('webpage_url')
\ No newline at end of file
+        self.webpage_url: Optional[str] = data.get('webpage_url')
+
+
+class SupervisedFFmpegMixin:
+    """FFmpeg 프로세스 실행/정리를 공용 관리자(FFmpegSupervisor)를 거쳐 처리
+
+    stderr를 객체로 넘긴 경우 discord.py는 파이프를 read(8192)로 읽어 8KB가 찰 때까지(보통 곡이 끝날 때까지)
+    write()를 호출하지 않으므로, 여기서는 줄 단위로 읽어 재연결 같은 경고를 바로 넘긴다.
+    """
+    _supervisor = None
+    _owner: Optional[int] = None
+
+    def _init_supervisor(self, supervisor, guild_id: Optional[int]):
+        self._supervisor = supervisor
+        self._owner = guild_id
+
+    def _spawn_process(self, args, **subprocess_kwargs):
+        spawn = super()._spawn_process
+        if self._supervisor is None:
+            return spawn(args, **subprocess_kwargs)
+        return self._supervisor.spawn(lambda: spawn(args, **subprocess_kwargs), self._owner)
+
+    def _pipe_reader(self, dest):
+        stderr = self._stderr
+        if stderr is None:
+            return
+        try:
+            for line in iter(stderr.readline, b''):
+                dest.write(line)
+        except Exception:
+            # 정리 중 파이프가 닫히면 읽기가 실패할 수 있음
+            return
+
+    def cleanup(self):
+        process = getattr(self, '_process', None)
+        super().cleanup()
+        if self._supervisor is not None and process:
+            self._supervisor.release(process)
+
+
+class SupervisedPCMAudio(SupervisedFFmpegMixin, discord.FFmpegPCMAudio):
+    """관리자에 등록되는 FFmpegPCMAudio"""
+    def __init__(self, source: str, *, supervisor=None, guild_id: Optional[int] = None, **kwargs):
+        self._init_supervisor(supervisor, guild_id)
+        super().__init__(source, **kwargs)
+
+
+class YTDLPSource(TrackInfoMixin, discord.AudioSource):
+    """PCM 재생 소스 (볼륨은 GainStage로 프레임마다 적용)"""
+    def __init__(self, source: discord.AudioSource, *, data: dict, volume: float = 0.5):
+        if source.is_opus():
+            raise discord.ClientException('AudioSource must not be Opus encoded.')
+        self.original = source
+        self._gain = GainStage(volume)
+        self._init_track_info(data)
+
+    @property
+    def volume(self) -> float:
+        return self._gain.target
+
+    @volume.setter
+    def volume(self, value: float):
+        # 갑작스러운 볼륨 변화로 인한 클릭 잡음이 없도록 몇 프레임에 걸쳐 변경
+        self._gain.set_gain(value)
+
+    def read(self) -> bytes:
+        return self._gain.process(self.original.read())
+
+    def cleanup(self):
+        self.original.cleanup()
+
+
+class YTDLPOpusSource(TrackInfoMixin, SupervisedFFmpegMixin, discord.FFmpegOpusAudio):
+    """FFmpeg이 만든 Opus 패킷을 그대로 보내는 재생 소스
+
+    PCM 디코딩 -> 파이썬 볼륨 조절 -> discord.py Opus 인코딩 과정을 생략한다.
+    원본이 Opus이고 볼륨이 1.0이면 재인코딩 없이 복사하고,
+    볼륨을 바꿔야 하거나 원본이 Opus가 아니면 FFmpeg이 libopus로 인코딩한다.
+    (discord.py는 codec이 'opus'/'libopus'/'copy'면 모두 -c:a copy로 바꾸므로,
+    인코딩이 필요할 때는 codec=None을 넘겨야 libopus가 사용된다)
+    """
+    def __init__(self, url: str, *, data: dict, volume: float = 1.0,
+                 before_options: Optional[str] = None, options: Optional[str] = None, stderr=None,
+                 supervisor=None, guild_id: Optional[int] = None):
+        self._init_supervisor(supervisor, guild_id)
+        self.volume = volume
+        codec = 'copy' if volume == 1.0 and data.get('acodec') == 'opus' else None
+        if volume != 1.0:
+            options = f"{options or ''} -filter:a volume={volume}".strip()
+        super().__init__(url, codec=codec, before_options=before_options, options=options, stderr=stderr)
+        self._init_track_info(data)
+
+
+# 재생에 사용하는 오디오 소스 타입 (PCM 경로 / Opus 패스스루 경로)
+PlayableSource = Union[YTDLPSource, YTDLPOpusSource]
@@ -0,0 +1,177 @@
+import asyncio
+import os
+import shlex
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+
+class AudioCache:
+    """자주 재생되는 곡을 Opus 파일로 저장해 두는 디스크 캐시
+
+    곡의 재생 횟수가 기준을 넘으면 백그라운드에서 파일을 만들고,
+    전체 용량이 제한을 넘으면 가장 오래 재생되지 않은 파일부터 지운다 (LRU).
+    목록 관리는 이벤트 루프에서 하고, 파일 조회/삭제/이동은 run_io(디스크 입출력 스레드)로 실행한다.
+    """
+
+    FILE_EXTENSION = '.opus'
+
+    def __init__(self, directory: str, max_bytes: int, play_threshold: int,
+                 run_io: Callable[[Callable[[], Any]], Awaitable[Any]],
+                 before_options: str = '', max_concurrent_fills: int = 2):
+        self.directory = directory
+        self.run_io = run_io
+        self.max_bytes = max_bytes
+        self.play_threshold = play_threshold
+        self.before_options = before_options
+        # video_id -> 파일 크기 (오래 재생되지 않은 순서)
+        self.files: 'OrderedDict[str, int]' = OrderedDict()
+        self.total_bytes = 0
+        # 재생 횟수는 최근 곡 위주로만 보관
+        self.play_counts: 'OrderedDict[str, int]' = OrderedDict()
+        self.max_tracked_plays = 10000
+        self.filling: Set[str] = set()
+        self._fill_semaphore = asyncio.Semaphore(max_concurrent_fills)
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, video_id: str) -> str:
+        return os.path.join(self.directory, f"{video_id}{self.FILE_EXTENSION}")
+
+    def load(self):
+        """디렉터리를 읽어 캐시 목록 구성 (수정 시각 순, 입출력 스레드에서 호출)"""
+        os.makedirs(self.directory, exist_ok=True)
+        found = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(self.FILE_EXTENSION):
+                stat = entry.stat()
+                found.append((stat.st_mtime, entry.name[:-len(self.FILE_EXTENSION)], stat.st_size))
+            elif entry.name.endswith('.tmp'):
+                # 이전 실행에서 중단된 임시 파일 정리
+                os.remove(entry.path)
+
+        for _, video_id, size in sorted(found):
+            self.files[video_id] = size
+            self.total_bytes += size
+        self._remove_files(self._evict())
+
+    def get_path(self, video_id: Optional[str]) -> Optional[str]:
+        """캐시된 파일 경로 반환"""
+        if video_id and video_id in self.files:
+            self.files.move_to_end(video_id)
+            self.hits += 1
+            return self._path(video_id)
+        self.misses += 1
+        return None
+
+    def record_play(self, video_id: Optional[str]) -> bool:
+        """재생 횟수 기록, 캐시 파일을 새로 만들어야 하면 True"""
+        if not video_id:
+            return False
+        if video_id in self.files:
+            return False
+
+        count = self.play_counts.pop(video_id, 0) + 1
+        self.play_counts[video_id] = count
+        while len(self.play_counts) > self.max_tracked_plays:
+            self.play_counts.popitem(last=False)
+
+        return count >= self.play_threshold and video_id not in self.filling
+
+    async def on_play(self, data: Dict[str, Any]):
+        """재생 기록 (캐시된 곡은 수정 시각 갱신, 재생 횟수가 기준을 넘은 곡은 파일 생성)"""
+        video_id = data.get('id')
+        if video_id in self.files:
+            # 다음 실행에서도 최근 재생 순서가 유지되도록 수정 시각 갱신
+            await self.run_io(partial(self._touch, self._path(video_id)))
+        elif self.record_play(video_id):
+            await self.fill(data)
+
+    async def fill(self, data: Dict[str, Any]):
+        """스트림을 받아 Opus 파일로 저장 (원본이 Opus면 재인코딩 없이 복사)"""
+        video_id = data.get('id')
+        stream_url = data.get('url')
+        if not video_id or not stream_url or video_id in self.filling or video_id in self.files:
+            return
+
+        self.filling.add(video_id)
+        path = self._path(video_id)
+        tmp_path = f"{path}.tmp"
+        codec = ['-c:a', 'copy'] if data.get('acodec') == 'opus' else ['-c:a', 'libopus', '-b:a', '128k']
+        try:
+            async with self._fill_semaphore:
+                process = await asyncio.create_subprocess_exec(
+                    'ffmpeg', '-nostdin', '-loglevel', 'error', '-y',
+                    *shlex.split(self.before_options),
+                    '-i', stream_url, '-vn', *codec, '-f', 'opus', tmp_path,
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.PIPE
+                )
+                _, stderr = await process.communicate()
+
+            if process.returncode != 0:
+                logger.warning("Error filling audio cache", video_id=video_id,
+                               error=stderr.decode(errors='ignore').strip())
+                return
+
+            size = await self.run_io(partial(self._commit, tmp_path, path))
+            self.files[video_id] = size
+            self.total_bytes += size
+            self.play_counts.pop(video_id, None)
+            evicted = self._evict()
+            if evicted:
+                await self.run_io(partial(self._remove_files, evicted))
+        except Exception as e:
+            logger.warning("Error filling audio cache", video_id=video_id, error=e)
+        finally:
+            self.filling.discard(video_id)
+            await self.run_io(partial(self._remove_tmp, tmp_path))
+
+    def _evict(self) -> List[str]:
+        """용량 초과 시 가장 오래 재생되지 않은 곡을 목록에서 빼고, 지울 파일 경로 반환"""
+        paths = []
+        while self.total_bytes > self.max_bytes and self.files:
+            video_id, size = self.files.popitem(last=False)
+            self.total_bytes -= size
+            paths.append(self._path(video_id))
+        return paths
+
+    @staticmethod
+    def _touch(path: str):
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _commit(tmp_path: str, path: str) -> int:
+        """완성된 임시 파일을 캐시 파일로 바꾸고 크기 반환"""
+        os.replace(tmp_path, path)
+        return os.path.getsize(path)
+
+    @staticmethod
+    def _remove_tmp(tmp_path: str):
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    @staticmethod
+    def _remove_files(paths: List[str]):
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.warning("Error evicting cached audio", path=path, error=e)
+
+    def get_stats(self) -> Dict[str, int]:
+        """오디오 캐시 통계 반환"""
+        return {
+            'files': len(self.files),
+            'bytes': self.total_bytes,
+            'filling': len(self.filling),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
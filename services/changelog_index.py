@@ -0,0 +1,141 @@
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+# "## [1.7.0](compare-url) (2025-02-15)", "### [1.0.2](...) (...)", "### 1.0.1 (2025-02-15)"
+RELEASE_HEADING = re.compile(r'^#{2,3}\s+\[?v?(\d+\.\d+\.\d+[\w.-]*)\]?(?:\(([^)]*)\))?\s*(?:\((\d{4}-\d{2}-\d{2})\))?')
+SECTION_HEADING = re.compile(r'^#{3,4}\s+(.+?)\s*$')
+# 항목 끝의 커밋 링크 " ([958ef24](https://.../commit/...))"
+COMMIT_LINK = re.compile(r'\s*\(\[[0-9a-f]{7,40}\]\([^)]*\)\)\s*$')
+
+
+class ChangelogIndex:
+    """CHANGELOG.md와 package.json을 한 번만 읽어 버전별로 정리해 두는 색인
+
+    /version은 디스크를 읽지 않고 색인에서 바로 찾는다.
+    파일 수정 시각(mtime)이 바뀌었을 때만 다시 읽으며, 수정 시각 확인도 check_interval초에 한 번만 한다.
+    refresh는 파일을 읽으므로 입출력 스레드에서 호출한다.
+    """
+
+    def __init__(self, changelog_path: str, package_path: str, check_interval: float = 30.0):
+        self.changelog_path = changelog_path
+        self.package_path = package_path
+        self.check_interval = check_interval
+        self.current_version: Optional[str] = None
+        self.repo_url = ''
+        # 버전 -> {'version', 'date', 'url', 'sections': {섹션 이름: [항목, ...]}}
+        self.releases: Dict[str, Dict[str, Any]] = {}
+        # 최신 버전부터 (CHANGELOG.md 순서)
+        self.versions: List[str] = []
+        self._mtimes: Tuple[Optional[float], Optional[float]] = (None, None)
+        self._last_check: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _mtime(path: str) -> Optional[float]:
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return None
+
+    def needs_check(self) -> bool:
+        """마지막 수정 시각 확인 후 check_interval초가 지났는지 여부"""
+        return self._last_check is None or time.monotonic() - self._last_check >= self.check_interval
+
+    def refresh(self) -> bool:
+        """두 파일 중 하나라도 수정 시각이 바뀌었으면 다시 읽기 (다시 읽었으면 True)"""
+        with self._lock:
+            self._last_check = time.monotonic()
+            mtimes = (self._mtime(self.changelog_path), self._mtime(self.package_path))
+            if mtimes == self._mtimes:
+                return False
+
+            if mtimes[1] != self._mtimes[1]:
+                self._load_package()
+            if mtimes[0] != self._mtimes[0]:
+                self._load_changelog()
+            self._mtimes = mtimes
+            return True
+
+    def _load_package(self):
+        try:
+            with open(self.package_path, 'r', encoding='utf-8') as f:
+                package_data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("Error loading package.json", path=self.package_path, error=e)
+            self.current_version, self.repo_url = None, ''
+            return
+
+        self.current_version = package_data.get('version')
+        repo_url = package_data.get('repository', {}).get('url', '')
+        if repo_url.startswith('git+'):
+            repo_url = repo_url[4:]
+        if repo_url.endswith('.git'):
+            repo_url = repo_url[:-4]
+        self.repo_url = repo_url
+
+    def _load_changelog(self):
+        try:
+            with open(self.changelog_path, 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+        except OSError as e:
+            logger.warning("Error loading changelog", path=self.changelog_path, error=e)
+            self.releases, self.versions = {}, []
+            return
+
+        releases: Dict[str, Dict[str, Any]] = {}
+        versions: List[str] = []
+        release: Optional[Dict[str, Any]] = None
+        section: Optional[List[str]] = None
+
+        for line in lines:
+            match = RELEASE_HEADING.match(line)
+            if match:
+                version, url, date = match.groups()
+                release = {'version': version, 'date': self._format_date(date), 'url': url, 'sections': {}}
+                section = None
+                if version not in releases:
+                    versions.append(version)
+                releases[version] = release
+                continue
+            if release is None:
+                continue
+
+            match = SECTION_HEADING.match(line)
+            if match:
+                section = release['sections'].setdefault(match.group(1), [])
+                continue
+
+            stripped = line.strip()
+            if stripped.startswith(('* ', '- ')) and section is not None:
+                section.append(COMMIT_LINK.sub('', stripped[2:]))
+
+        self.releases, self.versions = releases, versions
+
+    @staticmethod
+    def _format_date(date: Optional[str]) -> Optional[str]:
+        if not date:
+            return None
+        try:
+            return datetime.strptime(date, '%Y-%m-%d').strftime('%Y년 %m월 %d일')
+        except ValueError:
+            return date
+
+    def get(self, version: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """버전의 릴리즈 정보 (version이 없으면 현재 버전)"""
+        if version:
+            version = version.strip().lstrip('vV')
+        return self.releases.get(version or self.current_version)
+
+    def search(self, prefix: str, limit: int = 25) -> List[str]:
+        """prefix로 시작하는 버전 목록 (자동 완성용)"""
+        prefix = prefix.strip().lstrip('vV')
+        return [version for version in self.versions if version.startswith(prefix)][:limit]
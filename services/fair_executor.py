@@ -0,0 +1,98 @@
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Hashable, Optional, Tuple
+
+from utils.metrics import registry
+
+
+class FairExecutor:
+    """작업 종류별 전용 스레드 풀 + 길드별 공정 대기열
+
+    작업을 바로 스레드 풀에 넣지 않고 키(길드 ID)별 대기열에 모아 두었다가,
+    스레드가 비면 키를 돌아가며 하나씩 꺼내 실행한다 (라운드 로빈).
+    한 길드가 큰 재생목록으로 작업을 수백 개 넣어도 다른 길드의 작업은 다음 차례에 바로 실행된다.
+    대기열 조작은 모두 이벤트 루프 스레드에서만 일어난다.
+    """
+
+    def __init__(self, name: str, workers: int):
+        self.name = name
+        self.workers = max(1, workers)
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=f'{name}-executor')
+        self._queues: Dict[Hashable, Deque[Tuple[Callable[[], Any], asyncio.Future, float]]] = {}
+        # 대기 중인 작업이 있는 키 (실행 차례 순서)
+        self._ready: Deque[Hashable] = deque()
+        self.in_flight = 0
+        self.depth = 0
+        self.completed = 0
+        self.wait_stats = registry.stats('executor_wait_seconds', executor=name)
+        self.run_stats = registry.stats('executor_run_seconds', executor=name)
+
+    async def run(self, key: Optional[Hashable], func: Callable[[], Any]) -> Any:
+        """key의 대기열에 작업을 넣고 결과를 기다림 (key가 None이면 공용 대기열)"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = deque()
+            self._ready.append(key)
+        queue.append((func, future, time.perf_counter()))
+        self.depth += 1
+        self._dispatch(loop)
+        return await future
+
+    def _dispatch(self, loop):
+        while self.in_flight < self.workers and self._ready:
+            key = self._ready.popleft()
+            queue = self._queues[key]
+            func, future, enqueued_at = queue.popleft()
+            self.depth -= 1
+            if queue:
+                self._ready.append(key)
+            else:
+                del self._queues[key]
+            # 기다리던 쪽이 이미 취소했으면 실행하지 않음
+            if future.done():
+                continue
+
+            started = time.perf_counter()
+            self.wait_stats.add(started - enqueued_at)
+            self.in_flight += 1
+            job = loop.run_in_executor(self._pool, func)
+            job.add_done_callback(lambda job, future=future, started=started: self._finish(loop, job, future, started))
+
+    def _finish(self, loop, job: asyncio.Future, future: asyncio.Future, started: float):
+        self.in_flight -= 1
+        self.completed += 1
+        self.run_stats.add(time.perf_counter() - started)
+        if not future.done():
+            if job.cancelled():
+                future.cancel()
+            elif job.exception() is not None:
+                future.set_exception(job.exception())
+            else:
+                future.set_result(job.result())
+        self._dispatch(loop)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """대기열 깊이, 실행 중인 작업 수, 대기 시간 통계"""
+        return {
+            'workers': self.workers,
+            'in_flight': self.in_flight,
+            'depth': self.depth,
+            'keys': len(self._queues),
+            'max_key_depth': max((len(queue) for queue in self._queues.values()), default=0),
+            'completed': self.completed,
+            'wait': self.wait_stats.summary(),
+            'run': self.run_stats.summary(),
+        }
+
+    def shutdown(self):
+        for queue in self._queues.values():
+            for _, future, _ in queue:
+                future.cancel()
+        self._queues.clear()
+        self._ready.clear()
+        self.depth = 0
+        self._pool.shutdown(wait=False)
@@ -0,0 +1,111 @@
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from utils.exceptions import FFmpegLimitError
+from utils.process import process_rss
+
+
+@dataclass
+class ProcessRecord:
+    process: subprocess.Popen
+    guild_id: Optional[int]
+    started_at: float
+
+
+class FFmpegSupervisor:
+    """재생용 FFmpeg 자식 프로세스를 한곳에서 관리
+
+    - 동시에 실행할 수 있는 프로세스 수를 제한하고, 넘으면 FFmpegLimitError
+    - 종료된 프로세스는 poll()로 회수해 좀비가 남지 않게 함
+    - 대기열 초기화/음성 연결 종료 시 재생되지 못하고 남은 해당 길드의 프로세스 종료
+    discord.py가 소스를 만들 때와 정리할 때 다른 스레드에서 호출될 수 있어 잠금으로 보호한다.
+    """
+
+    def __init__(self, max_processes: int):
+        self.max_processes = max(1, max_processes)
+        self.processes: Dict[int, ProcessRecord] = {}
+        self._lock = threading.Lock()
+        self.spawned = 0
+        self.rejected = 0
+        self.reaped = 0
+        self.killed = 0
+
+    def spawn(self, factory: Callable[[], subprocess.Popen], guild_id: Optional[int] = None) -> subprocess.Popen:
+        """한도 안에서 프로세스 실행 (factory는 실제 Popen을 호출)"""
+        with self._lock:
+            self._reap_locked()
+            if len(self.processes) >= self.max_processes:
+                self.rejected += 1
+                raise FFmpegLimitError(f"FFmpeg 프로세스 한도({self.max_processes}개)를 초과했습니다.")
+            process = factory()
+            self.processes[process.pid] = ProcessRecord(process, guild_id, time.monotonic())
+            self.spawned += 1
+            return process
+
+    def release(self, process: subprocess.Popen):
+        """소스 정리 후 호출 (discord.py가 kill한 프로세스를 목록에서 제거, 아직 종료 전이면 다음 회수 때 처리)"""
+        with self._lock:
+            if process.poll() is not None and self.processes.pop(process.pid, None):
+                self.reaped += 1
+
+    def _reap_locked(self):
+        for pid, record in list(self.processes.items()):
+            if record.process.poll() is not None:
+                del self.processes[pid]
+                self.reaped += 1
+
+    def reap(self) -> int:
+        """종료된 프로세스 회수"""
+        with self._lock:
+            before = self.reaped
+            self._reap_locked()
+            return self.reaped - before
+
+    def kill_guild(self, guild_id: int, keep: Optional[subprocess.Popen] = None) -> int:
+        """길드에 속한 프로세스 종료 (재생되지 못하고 남은 프로세스 포함, keep은 제외)"""
+        with self._lock:
+            targets = [
+                record for record in self.processes.values()
+                if record.guild_id == guild_id and record.process is not keep
+            ]
+        return self._kill(targets)
+
+    def kill_all(self) -> int:
+        """모든 프로세스 종료 (봇 종료 시)"""
+        with self._lock:
+            targets = list(self.processes.values())
+        return self._kill(targets)
+
+    def _kill(self, records: List[ProcessRecord]) -> int:
+        killed = 0
+        for record in records:
+            if record.process.poll() is None:
+                try:
+                    record.process.kill()
+                    killed += 1
+                except OSError:
+                    pass
+        with self._lock:
+            self.killed += killed
+            self._reap_locked()
+        return killed
+
+    def get_stats(self) -> Dict[str, int]:
+        """실행 중인 프로세스 수와 메모리 사용량 (RSS 합계)"""
+        self.reap()
+        with self._lock:
+            pids = list(self.processes)
+            guilds = {record.guild_id for record in self.processes.values()}
+        return {
+            'live': len(pids),
+            'max': self.max_processes,
+            'guilds': len(guilds),
+            'rss_bytes': sum(process_rss(pid) or 0 for pid in pids),
+            'spawned': self.spawned,
+            'rejected': self.rejected,
+            'reaped': self.reaped,
+            'killed': self.killed,
+        }
@@ -0,0 +1,84 @@
+import asyncio
+import heapq
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+# 종료 사유: 대기열이 비어 재생하지 않음 / 음성 채널에 봇 말고 아무도 없음
+IDLE = 'idle'
+EMPTY = 'empty'
+REASONS = (IDLE, EMPTY)
+
+# (길드 ID, 사유)
+TimerKey = Tuple[int, str]
+
+
+class IdleVoiceReaper:
+    """음성 연결 종료 예약을 한곳에서 관리하는 타이머 힙
+
+    길드마다 sleep 중인 코루틴을 두지 않고, (만료 시각, 길드, 사유)를 힙 하나에 넣어 두고
+    작업 하나가 interval마다 힙 맨 앞의 만료된 항목만 꺼낸다. 예약/취소는 O(log n)이며,
+    취소된 항목은 힙에서 바로 지우지 않고 꺼낼 때 건너뛴다 (취소된 항목이 많아지면 힙을 다시 만든다).
+    만료되면 on_expire(guild_id, reason)를 별도 작업으로 실행하며, 실제로 끊을지는 콜백이 다시 확인한다.
+    """
+
+    def __init__(self, on_expire: Callable[[int, str], Awaitable[None]], interval: float = 5.0):
+        self.on_expire = on_expire
+        self.interval = interval
+        # 유효한 예약: 키 -> 만료 시각
+        self.deadlines: Dict[TimerKey, float] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._tasks: Set[asyncio.Task] = set()
+
+    def schedule(self, guild_id: int, reason: str, delay: float, replace: bool = False):
+        """delay초 뒤 종료 예약 (이미 예약되어 있으면 replace일 때만 다시 예약)"""
+        key = (guild_id, reason)
+        if key in self.deadlines and not replace:
+            return
+        deadline = time.monotonic() + delay
+        self.deadlines[key] = deadline
+        heapq.heappush(self._heap, (deadline, guild_id, reason))
+
+    def cancel(self, guild_id: int, reason: Optional[str] = None):
+        """예약 취소 (reason이 없으면 길드의 모든 예약)"""
+        if reason is not None:
+            self.deadlines.pop((guild_id, reason), None)
+        else:
+            for reason in REASONS:
+                self.deadlines.pop((guild_id, reason), None)
+        # 취소된 항목이 유효한 항목보다 훨씬 많아지면 힙을 다시 만들어 메모리 회수
+        if len(self._heap) > 64 and len(self._heap) > 4 * len(self.deadlines):
+            self._heap = [(deadline, guild_id, reason) for (guild_id, reason), deadline in self.deadlines.items()]
+            heapq.heapify(self._heap)
+
+    def tick(self, now: Optional[float] = None) -> List[TimerKey]:
+        """만료된 예약을 꺼내 반환 (힙 맨 앞만 확인하므로 만료된 항목이 없으면 O(1))"""
+        now = time.monotonic() if now is None else now
+        expired = []
+        while self._heap and self._heap[0][0] <= now:
+            deadline, guild_id, reason = heapq.heappop(self._heap)
+            key = (guild_id, reason)
+            # 취소되었거나 다시 예약된 항목은 건너뜀
+            if self.deadlines.get(key) != deadline:
+                continue
+            del self.deadlines[key]
+            expired.append(key)
+        return expired
+
+    async def run(self):
+        """interval마다 만료된 예약 처리"""
+        while True:
+            await asyncio.sleep(self.interval)
+            for guild_id, reason in self.tick():
+                task = asyncio.create_task(self._expire(guild_id, reason))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+    async def _expire(self, guild_id: int, reason: str):
+        try:
+            await self.on_expire(guild_id, reason)
+        except Exception as e:
+            logger.warning("Error disconnecting idle voice client", guild_id=guild_id, reason=reason, error=e)
@@ -0,0 +1,124 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import Any, Dict, List, Optional
+
+from config.bot_config import PROJECT_ROOT
+from utils.log import get_logger
+from utils.metrics import registry
+
+logger = get_logger(__name__)
+
+
+class LoopMonitor:
+    """이벤트 루프 지연 측정과 오래 걸리는 콜백의 스택 수집
+
+    루프 안에서는 interval마다 깨어나 예정보다 늦게 깨어난 만큼을 지연으로 기록하고(하트비트),
+    별도 감시 스레드는 하트비트가 threshold 넘게 밀리면 그 순간 루프 스레드의 스택을
+    sys._current_frames()로 찍어 둔다. 루프가 풀리면 실제로 막힌 시간을 해당 위치에 합산한다.
+    위치는 스택에서 가장 안쪽에 있는 프로젝트 코드 프레임으로 묶어, /lag에서 가장 오래 막은 곳부터 보여준다.
+    """
+
+    def __init__(self, interval: float = 0.5, threshold: float = 0.25,
+                 max_offenders: int = 50, stack_depth: int = 12):
+        self.interval = interval
+        self.threshold = threshold
+        self.max_offenders = max_offenders
+        self.stack_depth = stack_depth
+        self.lag_stats = registry.stats('event_loop_lag_seconds')
+        self.lag_histogram = registry.histogram('event_loop_lag_ms', (5, 20, 50, 100, 250, 1000))
+        self.stalls = registry.counter('event_loop_stalls')
+        # 위치 -> {'location', 'count', 'total', 'max', 'stack', 'last_seen'}
+        self.offenders: Dict[str, Dict[str, Any]] = {}
+        self._heartbeat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        # 감시 스레드가 찍어 두고 루프가 풀린 뒤 막힌 시간을 채우는 스택
+        self._stall: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    async def run(self):
+        """하트비트 루프 (이벤트 루프에서 실행, 감시 스레드도 함께 시작)"""
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name='loop-monitor', daemon=True)
+        self._thread.start()
+        try:
+            while True:
+                expected = time.monotonic() + self.interval
+                await asyncio.sleep(self.interval)
+                now = time.monotonic()
+                self._beat(now, max(0.0, now - expected))
+        finally:
+            self._stop.set()
+
+    def _beat(self, now: float, lag: float):
+        self.lag_stats.add(lag)
+        self.lag_histogram.observe(lag * 1000)
+        with self._lock:
+            self._heartbeat = now
+            stall, self._stall = self._stall, None
+        if stall is not None:
+            self._record(stall, lag)
+
+    def _watch(self):
+        # threshold의 절반 간격으로 확인하므로 threshold~1.5배 사이에 스택을 찍는다
+        while not self._stop.wait(self.threshold / 2):
+            with self._lock:
+                blocked = time.monotonic() - self._heartbeat - self.interval
+                if blocked < self.threshold or self._stall is not None:
+                    continue
+                frame = sys._current_frames().get(self._loop_thread_id)
+                if frame is None:
+                    continue
+                stack = traceback.extract_stack(frame)[-self.stack_depth:]
+                del frame
+                stall = self._stall = {'location': self._locate(stack), 'stack': ''.join(traceback.format_list(stack))}
+            logger.warning("Event loop blocked\n%s", stall['stack'].rstrip(), blocked=blocked, location=stall['location'])
+
+    @staticmethod
+    def _locate(stack: List[traceback.FrameSummary]) -> str:
+        """스택에서 가장 안쪽의 프로젝트 코드 프레임 (없으면 가장 안쪽 프레임)"""
+        for frame in reversed(stack):
+            if frame.filename.startswith(PROJECT_ROOT) and os.sep + 'site-packages' + os.sep not in frame.filename:
+                return f"{os.path.relpath(frame.filename, PROJECT_ROOT)}:{frame.lineno} {frame.name}"
+        frame = stack[-1]
+        return f"{os.path.basename(frame.filename)}:{frame.lineno} {frame.name}"
+
+    def _record(self, stall: Dict[str, Any], duration: float):
+        self.stalls.inc()
+        location = stall['location']
+        offender = self.offenders.get(location)
+        if offender is None:
+            if len(self.offenders) >= self.max_offenders:
+                # 가장 짧게 막았던 위치를 버림
+                del self.offenders[min(self.offenders, key=lambda key: self.offenders[key]['max'])]
+            offender = self.offenders[location] = {
+                'location': location, 'count': 0, 'total': 0.0, 'max': 0.0, 'stack': '', 'last_seen': 0.0
+            }
+        offender['count'] += 1
+        offender['total'] += duration
+        if duration >= offender['max']:
+            offender['max'] = duration
+            offender['stack'] = stall['stack']
+        offender['last_seen'] = time.time()
+
+    def worst(self, limit: int = 5) -> List[Dict[str, Any]]:
+        """가장 오래 막았던 위치부터"""
+        return sorted(self.offenders.values(), key=lambda offender: offender['max'], reverse=True)[:limit]
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'lag': self.lag_stats.summary(),
+            'buckets': self.lag_histogram.summary()['buckets'],
+            'stalls': self.stalls.value,
+            'threshold': self.threshold,
+        }
+
+    def stop(self):
+        self._stop.set()
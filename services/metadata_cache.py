@@ -0,0 +1,203 @@
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+from utils.files import write_json_atomic
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+
+# 캐시에 저장할 메타데이터 필드
+CACHED_FIELDS = ('id', 'title', 'duration', 'thumbnail', 'webpage_url', 'url', 'acodec')
+
+_VIDEO_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{11}$')
+
+
+class MetadataCache:
+    """yt-dlp 추출 결과를 디스크에 보관하는 LRU 캐시
+
+    영상 ID를 키로 메타데이터를 저장하고, 정규화된 검색어는 영상 ID로 연결한다.
+    googlevideo 스트림 URL은 만료되므로 TTL이 지나면 URL만 버리고 메타데이터는 유지한다.
+    """
+
+    def __init__(self, path: Optional[str], max_entries: int = 1000, stream_url_ttl: float = 5 * 60 * 60):
+        self.path = path
+        self.max_entries = max_entries
+        self.stream_url_ttl = stream_url_ttl
+        self.entries: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self.queries: 'OrderedDict[str, str]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.dirty = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """검색어 정규화 (대소문자, 공백, ytsearch 접두어, '가사' 접미어)"""
+        words = query.lower().split()
+        if words and words[0].startswith('ytsearch:'):
+            words[0] = words[0][len('ytsearch:'):]
+            if not words[0]:
+                words.pop(0)
+        # 검색 시 '가사'를 자동으로 붙이므로 있든 없든 같은 검색어로 취급
+        if words and words[-1].endswith('가사'):
+            words[-1] = words[-1][:-len('가사')]
+            if not words[-1]:
+                words.pop()
+        return ' '.join(words)
+
+    @staticmethod
+    def extract_video_id(url: str) -> Optional[str]:
+        """유튜브 URL에서 영상 ID 추출 (재생목록 URL은 None)"""
+        parsed = urlparse(url if '://' in url else f"https://{url}")
+        params = parse_qs(parsed.query)
+        if 'list' in params:
+            return None
+
+        host = parsed.netloc.lower()
+        video_id = None
+        if host.endswith('youtu.be'):
+            video_id = parsed.path.lstrip('/').split('/')[0]
+        elif host.endswith('youtube.com'):
+            if parsed.path == '/watch':
+                video_id = params.get('v', [None])[0]
+            elif parsed.path.startswith(('/shorts/', '/embed/', '/live/')):
+                video_id = parsed.path.split('/')[2]
+
+        if video_id and _VIDEO_ID_PATTERN.match(video_id):
+            return video_id
+        return None
+
+    def _stream_expires_at(self, url: str) -> float:
+        """스트림 URL 만료 시각 계산 (googlevideo의 expire 파라미터 우선)"""
+        expires_at = time.time() + self.stream_url_ttl
+        expire = parse_qs(urlparse(url).query).get('expire', [None])[0]
+        if expire and expire.isdigit():
+            # 만료 직전에 재생이 시작되지 않도록 1분 여유를 둔다
+            expires_at = min(expires_at, int(expire) - 60)
+        return expires_at
+
+    def get(self, video_id: str) -> Optional[Dict[str, Any]]:
+        """영상 ID로 메타데이터 조회 (만료된 스트림 URL은 제외하고 반환)"""
+        with self._lock:
+            entry = self.entries.get(video_id)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.entries.move_to_end(video_id)
+            self.hits += 1
+            data = {key: entry.get(key) for key in CACHED_FIELDS}
+            if not entry.get('url') or entry.get('url_expires_at', 0) <= time.time():
+                self.expired += 1
+                data['url'] = None
+            return data
+
+    def get_by_query(self, query: str) -> Optional[Dict[str, Any]]:
+        """정규화된 검색어로 메타데이터 조회"""
+        with self._lock:
+            video_id = self.queries.get(self.normalize_query(query))
+            if video_id is None or video_id not in self.entries:
+                self.misses += 1
+                return None
+            self.queries.move_to_end(self.normalize_query(query))
+        return self.get(video_id)
+
+    def put(self, data: Dict[str, Any], query: Optional[str] = None):
+        """추출 결과 저장"""
+        video_id = data.get('id')
+        if not video_id:
+            return
+
+        # 플랫 추출 결과의 url은 스트림이 아닌 영상 페이지 주소
+        if data.get('_type') == 'url':
+            data = {**data, 'webpage_url': data.get('webpage_url') or data.get('url'), 'url': None}
+
+        with self._lock:
+            entry = self.entries.get(video_id, {})
+            for key in CACHED_FIELDS:
+                if data.get(key) is not None:
+                    entry[key] = data[key]
+            if data.get('url') and data.get('url') != data.get('webpage_url'):
+                entry['url_expires_at'] = self._stream_expires_at(data['url'])
+            self.entries[video_id] = entry
+            self.entries.move_to_end(video_id)
+
+            self._evict()
+            self.dirty = True
+
+        if query:
+            self.link_query(query, video_id)
+
+    def link_query(self, query: str, video_id: str):
+        """정규화된 검색어를 영상 ID에 연결"""
+        key = self.normalize_query(query)
+        with self._lock:
+            if self.queries.get(key) == video_id:
+                self.queries.move_to_end(key)
+                return
+            self.queries[key] = video_id
+            self.queries.move_to_end(key)
+            self._evict()
+            self.dirty = True
+
+    def _evict(self):
+        """용량 초과 시 가장 오래 사용하지 않은 항목 제거"""
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        while len(self.queries) > self.max_entries:
+            self.queries.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, int]:
+        """캐시 적중 통계 반환"""
+        return {
+            'entries': len(self.entries),
+            'queries': len(self.queries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'expired': self.expired,
+        }
+
+    def load(self):
+        """디스크에서 캐시 불러오기"""
+        if not self.path or not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("Error loading metadata cache", path=self.path, error=e)
+            return
+
+        with self._lock:
+            self.entries = OrderedDict(payload.get('entries', []))
+            self.queries = OrderedDict(payload.get('queries', []))
+            self._evict()
+
+    def save(self):
+        """변경된 캐시를 디스크에 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self.path:
+            return
+
+        with self._lock:
+            if not self.dirty:
+                return
+            payload = {
+                'entries': list(self.entries.items()),
+                'queries': list(self.queries.items()),
+            }
+            self.dirty = False
+
+        try:
+            write_json_atomic(self.path, payload, ensure_ascii=False)
+        except OSError as e:
+            self.dirty = True
+            logger.warning("Error saving metadata cache", path=self.path, error=e)
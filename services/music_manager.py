@@ -1,136 +1,611 @@
 import yt_dlp
-import discord
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, AsyncIterator, Callable, Set, Tuple
 import asyncio
+import json
+import time
+from collections import deque
 
 from config.bot_config import BotConfig
-from models.music_source import YTDLPSource
-from utils.exceptions import MusicSourceError
+from models.music_queue import MusicQueue
+from models.music_source import PlayableSource, SupervisedPCMAudio, Track, YTDLPOpusSource, YTDLPSource
+from services.audio_cache import AudioCache
+from services.fair_executor import FairExecutor
+from services.ffmpeg_supervisor import FFmpegSupervisor
+from services.metadata_cache import MetadataCache
+from services.queue_store import QueueStore
+from services.playback_stats import FFmpegStderrMonitor, GuildPlaybackStats, MeteredSource
+from services.search_cache import SearchCache
+from services.ytdl_pool import YoutubeDLPool
+from utils.exceptions import FFmpegLimitError, MusicSourceError
+from utils.log import get_logger
+from utils.metrics import RollingStats
+
+logger = get_logger(__name__)
 
 
 class MusicManager:
-    def __init__(self, config: BotConfig):
+    def __init__(self, config: BotConfig, ydl_factory: Callable[[Dict[str, Any]], Any] = yt_dlp.YoutubeDL):
         self.config = config
-        self.ytdlp = yt_dlp.YoutubeDL(config.YTDLP_FORMAT_OPTIONS)
-        self.queue: Dict[int, List[YTDLPSource]] = {}
-        self.current: Dict[int, YTDLPSource] = {}
+        # 옵션 프로필별 YoutubeDL 풀 (flat: 검색/재생목록, full: 스트림 URL 추출)
+        video_options = config.YTDLP_FORMAT_OPTIONS.copy()
+        video_options['extract_flat'] = False
+        self.ytdl_pools: Dict[str, YoutubeDLPool] = {
+            'flat': YoutubeDLPool(config.YTDLP_FORMAT_OPTIONS, config.YTDL_POOL_SIZE, ydl_factory),
+            'full': YoutubeDLPool(video_options, config.YTDL_POOL_SIZE, ydl_factory),
+        }
+        self.queue: Dict[int, MusicQueue] = {}
+        self.current: Dict[int, PlayableSource] = {}
+        self.metadata_cache = MetadataCache(
+            config.METADATA_CACHE_PATH,
+            max_entries=config.METADATA_CACHE_SIZE,
+            stream_url_ttl=config.STREAM_URL_TTL
+        )
+        self.metadata_cache.load()
+        self.search_cache = SearchCache(ttl=config.SEARCH_CACHE_TTL)
+        # 자주 재생되는 곡의 로컬 파일 캐시 (선택 기능)
+        self.audio_cache: Optional[AudioCache] = None
+        if config.AUDIO_CACHE_ENABLED:
+            self.audio_cache = AudioCache(
+                config.AUDIO_CACHE_DIR,
+                max_bytes=config.AUDIO_CACHE_MAX_MB * 1024 * 1024,
+                play_threshold=config.AUDIO_CACHE_PLAY_THRESHOLD,
+                run_io=self.run_io,
+                before_options=config.FFMPEG_OPTIONS.get('before_options', '')
+            )
+        self.background_tasks: Set[asyncio.Task] = set()
+        # 작업 종류별 전용 스레드 풀 (기본 executor를 discord.py와 나눠 쓰지 않고, 길드별로 차례대로 실행)
+        self.executors: Dict[str, FairExecutor] = {
+            'search': FairExecutor('search', config.SEARCH_WORKERS),
+            'extract': FairExecutor('extract', config.EXTRACT_WORKERS),
+            'disk': FairExecutor('disk', config.DISK_IO_WORKERS),
+        }
+        # 다음 곡 미리 준비 (guild_id -> (곡, 미리 띄운 오디오 소스))
+        self.prefetched: Dict[int, Tuple[Track, PlayableSource]] = {}
+        self.prefetch_tasks: Dict[int, asyncio.Task] = {}
+        self.started_at: Dict[int, float] = {}
+        # 곡 전환 공백 시간 (이전 곡 종료 -> 다음 곡 재생 시작)
+        self.gap_stats = RollingStats()
+        self.last_gap: Dict[int, float] = {}
+        # 재시작 후 복원할 대기열 저장소 (길드 대기열은 처음 접근할 때 불러옴)
+        self.queue_store = QueueStore(
+            config.QUEUE_STORE_PATH,
+            snapshot=self._snapshot_queue,
+            flush_interval=config.QUEUE_STORE_FLUSH_INTERVAL
+        )
+        self.queue_store.open()
+        # 재생용 FFmpeg 프로세스 관리 (동시 실행 수 제한, 남은 프로세스 정리)
+        self.ffmpeg_supervisor = FFmpegSupervisor(config.FFMPEG_MAX_PROCESSES)
+        # 길드별 재생 파이프라인 지표
+        self.playback_stats: Dict[int, GuildPlaybackStats] = {}
+
+    async def process_query(self, query: str, loop,
+                            on_track: Optional[Callable[[Track], None]] = None,
+                            guild_id: Optional[int] = None) -> List[Track]:
+        """사용자 쿼리 처리 (URL 또는 검색어)
 
-    async def process_query(self, query: str, loop) -> List[YTDLPSource]:
-        """사용자 쿼리 처리 (URL 또는 검색어)"""
+        on_track이 주어지면 준비된 곡을 재생목록 순서대로 즉시 전달한다.
+        """
+        tracks = []
+        async for track in self.stream_query(query, loop, guild_id):
+            tracks.append(track)
+            if on_track:
+                on_track(track)
+        return tracks
+
+    async def stream_query(self, query: str, loop, guild_id: Optional[int] = None) -> AsyncIterator[Track]:
+        """사용자 쿼리를 처리하면서 준비된 곡을 재생목록 순서대로 바로 반환 (guild_id: 공정 대기열 키)"""
         try:
+            search_query = None
+            video_id = None
             # URL이 아닌 경우 검색어로 처리
             if not any(s in query for s in ['youtube.com', 'youtu.be']):
                 # 뮤직비디오를 제외하기 위해 {검색어}+가사로 검색
                 if '가사' not in query:
                     query = f"{query} 가사"
+                search_query = query
                 query = f"ytsearch:{query}"
+            else:
+                video_id = MetadataCache.extract_video_id(query)
 
-            # 플레이리스트/영상 정보 가져오기
-            playlist_data = await loop.run_in_executor(
-                None,
-                lambda: self.ytdlp.extract_info(query, download=False)
-            )
+            # 캐시된 곡이면 검색/추출 생략
+            cached = None
+            if search_query and self.config.SEARCH_CACHE_PERSIST:
+                cached = self.metadata_cache.get_by_query(search_query)
+            elif video_id:
+                cached = self.metadata_cache.get(video_id)
+            track = Track.from_data(cached) if cached else None
+            if track:
+                yield track
+                return
+
+            # 플레이리스트/영상 정보 가져오기 (같은 검색어는 진행 중인 검색 결과를 공유)
+            def extract():
+                return self.executors['search'].run(
+                    guild_id,
+                    lambda: self.ytdl_pools['flat'].extract_info(query, download=False)
+                )
+
+            if search_query:
+                playlist_data = await self.search_cache.get_or_search(search_query, extract)
+            else:
+                playlist_data = await extract()
 
             if not playlist_data:
                 raise MusicSourceError("음원을 찾을 수 없습니다.")
 
-            return await self.process_playlist_data(playlist_data, loop)
+            async for track in self.iter_playlist_data(playlist_data, loop, search_query, guild_id):
+                yield track
 
         except Exception as e:
-            print(f"Error processing query: {e}")
+            logger.warning("Error processing query", guild_id=guild_id, query=query, error=e)
             raise MusicSourceError(f"음원 처리 중 오류 발생: {str(e)}")
+        finally:
+            await self.save_metadata_cache(loop)
 
-    async def process_playlist_data(self, playlist_data: Dict[str, Any], loop) -> List[YTDLPSource]:
+    async def process_playlist_data(self, playlist_data: Dict[str, Any], loop,
+                                    search_query: Optional[str] = None,
+                                    on_track: Optional[Callable[[Track], None]] = None,
+                                    guild_id: Optional[int] = None) -> List[Track]:
         """플레이리스트 데이터 처리"""
-        sources = []
+        tracks = []
+        async for track in self.iter_playlist_data(playlist_data, loop, search_query, guild_id):
+            tracks.append(track)
+            if on_track:
+                on_track(track)
+        return tracks
 
+    async def iter_playlist_data(self, playlist_data: Dict[str, Any], loop,
+                                 search_query: Optional[str] = None,
+                                 guild_id: Optional[int] = None) -> AsyncIterator[Track]:
+        """플레이리스트/단일 영상 데이터를 곡 단위로 반환"""
         # 플레이리스트인 경우
         if 'entries' in playlist_data:
-            entries = playlist_data['entries']
-            for entry in entries:
-                if entry:
-                    source = await self.create_source_from_data(entry, loop)
-                    if source:
-                        sources.append(source)
+            entries = [entry for entry in playlist_data['entries'] if entry]
+            async for track in self.iter_playlist_tracks(entries, loop, search_query, guild_id):
+                yield track
         # 단일 영상인 경우
         else:
-            source = await self.create_source_from_data(playlist_data, loop)
-            if source:
-                sources.append(source)
+            track = await self.create_track_from_data(playlist_data, loop, search_query, guild_id)
+            if track:
+                yield track
+
+    async def iter_playlist_tracks(self, entries: List[Dict[str, Any]], loop,
+                                   search_query: Optional[str] = None,
+                                   guild_id: Optional[int] = None) -> AsyncIterator[Track]:
+        """플레이리스트 항목을 동시에 처리하고 준비되는 대로 재생목록 순서에 맞춰 반환"""
+        concurrency = max(1, self.config.PLAYLIST_CONCURRENCY)
+        semaphore = asyncio.Semaphore(concurrency)
+        # 앞선 항목이 늦어져도 뒤 항목을 미리 처리할 수 있도록 동시 실행 수보다 넓게 예약
+        window = concurrency * 4
+        pending = deque()
+        remaining = iter(entries)
 
-        return sources
+        async def resolve(entry: Dict[str, Any]) -> Optional[Track]:
+            async with semaphore:
+                return await self.create_track_from_data(entry, loop, search_query, guild_id)
 
-    async def create_source_from_data(self, data: Dict[str, Any], loop) -> Optional[YTDLPSource]:
-        """음원 소스 생성"""
+        def schedule():
+            while len(pending) < window:
+                entry = next(remaining, None)
+                if entry is None:
+                    return
+                pending.append(asyncio.ensure_future(resolve(entry)))
+
+        try:
+            schedule()
+            while pending:
+                track = await pending.popleft()
+                schedule()
+                if track:
+                    yield track
+        finally:
+            # 중간에 소비가 중단되면 남은 작업 취소
+            for task in pending:
+                task.cancel()
+
+    async def create_track_from_data(self, data: Dict[str, Any], loop,
+                                     search_query: Optional[str] = None,
+                                     guild_id: Optional[int] = None) -> Optional[Track]:
+        """대기열에 넣을 곡 정보 생성 (스트림 URL은 재생 직전에 확인)"""
         try:
-            # 상세 정보가 필요한 경우 추가 정보 가져오기
-            if not data.get('url'):
-                webpage_url = data.get('webpage_url')
-                if not webpage_url:
-                    return None
+            # 플랫 항목에 제목이 있으면 상세 추출 없이 바로 사용
+            if data.get('_type') == 'url' and not data.get('title'):
+                cached = self.metadata_cache.get(data['id']) if data.get('id') else None
+                if cached:
+                    data = cached
+                else:
+                    webpage_url = data.get('webpage_url') or data.get('url')
+                    if not webpage_url:
+                        return None
+                    data = await self.extract_video_data(webpage_url, loop, guild_id)
+                    if not data:
+                        return None
+            else:
+                self.metadata_cache.put(data)
+
+            if search_query and data.get('id') and self.config.SEARCH_CACHE_PERSIST:
+                self.metadata_cache.link_query(search_query, data['id'])
+            return Track.from_data(data)
+
+        except Exception as e:
+            logger.warning("Error creating track", guild_id=guild_id, video_id=data.get('id'), error=e)
+            return None
+
+    async def extract_video_data(self, webpage_url: str, loop,
+                                 guild_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """영상 상세 정보(스트림 URL 포함) 추출"""
+        started = time.perf_counter()
+        data = await self.executors['extract'].run(
+            guild_id,
+            lambda: self.ytdl_pools['full'].extract_info(webpage_url, download=False)
+        )
+        # 전체 정보는 수백 KB일 수 있으므로 디버그 레벨에서만 직렬화
+        logger.debug("Extracted video info", guild_id=guild_id, url=webpage_url,
+                     latency=time.perf_counter() - started,
+                     payload=lambda: json.dumps(data, ensure_ascii=False, default=str))
+
+        if data:
+            self.metadata_cache.put(data)
+        return data
 
-                video_options = self.config.YTDLP_FORMAT_OPTIONS.copy()
-                video_options['extract_flat'] = False
+    async def resolve_stream_data(self, track: Track, loop,
+                                  guild_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """재생 가능한 스트림 URL이 포함된 영상 정보 반환 (캐시 우선)"""
+        data = self.metadata_cache.get(track.video_id) if track.video_id else None
+        if not data or not data.get('url'):
+            data = await self.extract_video_data(track.webpage_url, loop, guild_id)
+            await self.save_metadata_cache(loop)
 
-                with yt_dlp.YoutubeDL(video_options) as ydl:
-                    data = await loop.run_in_executor(
-                        None,
-                        lambda: ydl.extract_info(webpage_url, download=False)
-                    )
+        if not data or not data.get('url'):
+            return None
+        return data
+
+    async def create_audio_source(self, track: Track, loop,
+                                  guild_id: Optional[int] = None) -> Optional[PlayableSource]:
+        """재생 직전에 스트림 URL을 확인하고 오디오 소스 생성"""
+        try:
+            # 로컬 캐시 파일이 있으면 스트리밍 없이 바로 재생
+            local_path = self.audio_cache.get_path(track.video_id) if self.audio_cache else None
+            if local_path:
+                data = {**track.to_data(), 'url': local_path, 'acodec': 'opus'}
+                return self.build_audio_source(
+                    data, before_options=self._seek_options(None, track), guild_id=guild_id
+                )
 
+            data = await self.resolve_stream_data(track, loop, guild_id)
             if not data:
                 return None
 
-            # FFmpeg 오디오 소스 생성
-            audio_source = discord.FFmpegPCMAudio(
+            return self.build_audio_source(
+                data,
+                before_options=self._seek_options(self.config.FFMPEG_OPTIONS.get('before_options'), track),
+                guild_id=guild_id
+            )
+
+        except FFmpegLimitError:
+            raise
+        except Exception as e:
+            logger.warning("Error creating source", guild_id=guild_id, video_id=track.video_id, error=e)
+            return None
+
+    @staticmethod
+    def _seek_options(before_options: Optional[str], track: Track) -> Optional[str]:
+        """복원된 곡은 이전에 재생하던 위치부터 시작"""
+        if not track.position:
+            return before_options
+        return f"{before_options or ''} -ss {track.position:.1f}".strip()
+
+    def build_audio_source(self, data: Dict[str, Any], before_options: Optional[str],
+                           guild_id: Optional[int] = None) -> PlayableSource:
+        """재생 모드에 맞는 FFmpeg 오디오 소스 생성 (guild_id가 있으면 FFmpeg 실행/재연결 집계)"""
+        options = self.config.FFMPEG_OPTIONS.get('options')
+        stderr = None
+        if guild_id is not None:
+            stats = self.get_playback_stats(guild_id)
+            stats.record_spawn()
+            stderr = FFmpegStderrMonitor(stats)
+
+        mode = self.config.PLAYBACK_MODE
+        if mode == 'auto':
+            # 재인코딩 없이 Opus를 그대로 복사할 수 있을 때만 opus 모드 사용
+            passthrough = self.config.PLAYBACK_VOLUME == 1.0 and data.get('acodec') == 'opus'
+            mode = 'opus' if passthrough else 'pcm'
+
+        if mode == 'opus':
+            return YTDLPOpusSource(
                 data['url'],
-                **self.config.FFMPEG_OPTIONS
+                data=data,
+                volume=self.config.PLAYBACK_VOLUME,
+                before_options=before_options,
+                options=options,
+                stderr=stderr,
+                supervisor=self.ffmpeg_supervisor,
+                guild_id=guild_id
             )
 
-            return YTDLPSource(audio_source, data=data)
+        audio_source = SupervisedPCMAudio(
+            data['url'],
+            before_options=before_options,
+            options=options,
+            stderr=stderr,
+            supervisor=self.ffmpeg_supervisor,
+            guild_id=guild_id
+        )
+        return YTDLPSource(audio_source, data=data, volume=self.config.PLAYBACK_VOLUME)
+
+    async def get_audio_source(self, guild_id: int, track: Track, loop) -> Optional[PlayableSource]:
+        """미리 준비된 소스가 있으면 사용하고, 없으면 새로 생성"""
+        prefetched = self.prefetched.pop(guild_id, None)
+        if prefetched:
+            prefetched_track, source = prefetched
+            if prefetched_track is track:
+                return source
+            source.cleanup()
+        return await self.create_audio_source(track, loop, guild_id)
+
+    def schedule_prefetch(self, guild_id: int, loop):
+        """현재 곡 재생 중에 다음 곡들을 미리 준비"""
+        task = self.prefetch_tasks.pop(guild_id, None)
+        if task:
+            task.cancel()
+        if self.config.PREFETCH_COUNT > 0 and self._find_queue(guild_id):
+            self.prefetch_tasks[guild_id] = loop.create_task(self._prefetch(guild_id, loop))
+
+    def ensure_prefetch(self, guild_id: int, loop):
+        """재생 중인데 다음 곡이 준비되어 있지도, 준비 중이지도 않으면 미리 준비 시작
+
+        play_next는 재생을 시작할 때만 미리 준비를 예약하므로, 대기열이 빈 상태로 재생 중에
+        곡이 추가되면(재생 중 /play, 재생목록의 두 번째 곡) 여기서 예약한다.
+        """
+        if guild_id not in self.current:
+            return
+        task = self.prefetch_tasks.get(guild_id)
+        if task and not task.done():
+            return
+        prefetched = self.prefetched.get(guild_id)
+        if prefetched and prefetched[0] is self.get_queue(guild_id).peek():
+            return
+        self.schedule_prefetch(guild_id, loop)
+
+    async def _prefetch(self, guild_id: int, loop):
+        """다음 N곡의 스트림 URL을 확인하고, 현재 곡이 끝나기 직전에 다음 곡 FFmpeg 실행"""
+        try:
+            for track in self.get_queue(guild_id)[:self.config.PREFETCH_COUNT]:
+                await self.resolve_stream_data(track, loop, guild_id)
+
+            next_track = self.get_queue(guild_id).peek()
+            if next_track is None:
+                return
 
+            # 원격 스트림 연결이 오래 열려 있지 않도록 종료 직전까지 대기
+            current = self.current.get(guild_id)
+            if current and current.duration and guild_id in self.started_at:
+                elapsed = time.monotonic() - self.started_at[guild_id]
+                delay = current.duration - elapsed - self.config.PREFETCH_WARMUP_LEAD
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            if self.get_queue(guild_id).peek() is not next_track:
+                return
+            prefetched = self.prefetched.get(guild_id)
+            if prefetched and prefetched[0] is next_track:
+                return
+
+            source = await self.create_audio_source(next_track, loop, guild_id)
+            if source:
+                self.discard_prefetched(guild_id)
+                self.prefetched[guild_id] = (next_track, source)
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            print(f"Error creating source: {e}")
-            return None
+            logger.warning("Error prefetching next track", guild_id=guild_id, error=e)
 
-    def add_to_queue(self, guild_id: int, source: YTDLPSource):
-        """대기열에 곡 추가"""
-        if guild_id not in self.queue:
-            self.queue[guild_id] = []
-        self.queue[guild_id].append(source)
+    def discard_prefetched(self, guild_id: int):
+        """미리 준비한 소스와 작업 정리"""
+        task = self.prefetch_tasks.pop(guild_id, None)
+        if task and task is not asyncio.current_task():
+            task.cancel()
+        prefetched = self.prefetched.pop(guild_id, None)
+        if prefetched:
+            prefetched[1].cleanup()
+
+    async def load_audio_cache(self):
+        """오디오 캐시 디렉터리 읽기 (입출력 스레드에서)"""
+        if self.audio_cache:
+            await self.run_io(self.audio_cache.load)
+
+    def record_play(self, source: PlayableSource, loop):
+        """재생 횟수를 기록하고, 기준을 넘은 곡은 백그라운드에서 로컬 캐시 파일 생성"""
+        if self.audio_cache and source.data.get('id'):
+            task = loop.create_task(self.audio_cache.on_play(source.data))
+            self.background_tasks.add(task)
+            task.add_done_callback(self.background_tasks.discard)
+
+    def record_gap(self, guild_id: int, gap: float):
+        """곡 전환 공백 시간 기록"""
+        self.last_gap[guild_id] = gap
+        self.gap_stats.add(gap)
+
+    def get_gap_stats(self) -> Dict[str, Optional[float]]:
+        """곡 전환 공백 시간 통계 반환 (초)"""
+        return self.gap_stats.summary()
+
+    def get_playback_stats(self, guild_id: int) -> GuildPlaybackStats:
+        """길드별 재생 지표 반환 (없으면 생성)"""
+        if guild_id not in self.playback_stats:
+            self.playback_stats[guild_id] = GuildPlaybackStats(guild_id)
+        return self.playback_stats[guild_id]
+
+    def release_playback_stats(self, guild_id: int):
+        """음성 연결이 끊긴 길드의 재생 지표 제거 (길드별 라벨 지표가 계속 쌓이지 않도록)"""
+        stats = self.playback_stats.pop(guild_id, None)
+        if stats:
+            stats.close()
+
+    def meter_source(self, guild_id: int, source: PlayableSource) -> MeteredSource:
+        """재생 직전에 소스를 감싸 프레임 읽기 지표 기록"""
+        return MeteredSource(source, self.get_playback_stats(guild_id))
+
+    def record_playback_error(self, guild_id: int):
+        """재생 도중 FFmpeg 오류 종료 기록"""
+        self.get_playback_stats(guild_id).ffmpeg_errors.inc()
+
+    async def save_metadata_cache(self, loop):
+        """메타데이터 캐시 변경분을 디스크에 저장"""
+        if self.metadata_cache.dirty:
+            await self.run_io(self.metadata_cache.save)
+
+    async def run_io(self, func: Callable[[], Any]) -> Any:
+        """디스크 입출력 전용 스레드에서 실행"""
+        return await self.executors['disk'].run(None, func)
+
+    def get_executor_stats(self) -> Dict[str, Dict[str, Any]]:
+        """작업 종류별 대기열 깊이와 대기 시간"""
+        return {name: executor.get_stats() for name, executor in self.executors.items()}
+
+    def get_cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """메타데이터/검색 캐시 적중 통계 반환"""
+        return {
+            'metadata': self.metadata_cache.get_stats(),
+            'search': self.search_cache.get_stats(),
+        }
+
+    def add_to_queue(self, guild_id: int, track: Track, loop=None):
+        """대기열에 곡 추가 (loop가 있으면 재생 중에 맨 앞에 들어온 곡을 바로 미리 준비)"""
+        queue = self.get_queue(guild_id)
+        queue.append(track)
+        self.queue_store.mark_dirty(guild_id)
+        if loop is not None and queue.peek() is track:
+            self.ensure_prefetch(guild_id, loop)
 
-    def remove_from_queue(self, guild_id: int, index: int) -> Optional[YTDLPSource]:
+    def remove_from_queue(self, guild_id: int, index: int) -> Optional[Track]:
         """대기열에서 특정 곡 제거"""
-        if guild_id in self.queue and 0 <= index < len(self.queue[guild_id]):
-            return self.queue[guild_id].pop(index)
+        queue = self._find_queue(guild_id)
+        if queue and 0 <= index < len(queue):
+            self.queue_store.mark_dirty(guild_id)
+            return queue.remove_at(index)
         return None
 
+    def move_in_queue(self, guild_id: int, source: int, destination: int) -> bool:
+        """대기열 내 곡 위치 이동"""
+        queue = self._find_queue(guild_id)
+        if not queue or not (0 <= source < len(queue)) or not (0 <= destination < len(queue)):
+            return False
+        queue.move(source, destination)
+        self.queue_store.mark_dirty(guild_id)
+        return True
+
+    def shuffle_queue(self, guild_id: int):
+        """대기열 섞기"""
+        queue = self._find_queue(guild_id)
+        if queue:
+            queue.shuffle()
+            self.queue_store.mark_dirty(guild_id)
+
     def clear_queue(self, guild_id: int):
-        """대기열 초기화"""
-        if guild_id in self.queue:
-            self.queue[guild_id].clear()
-        if guild_id in self.current:
-            del self.current[guild_id]
+        """대기열 초기화 (재생 중인 곡 외에 남아 있는 FFmpeg 프로세스도 종료)"""
+        queue = self._find_queue(guild_id)
+        if queue:
+            queue.clear()
+        current = self.current.pop(guild_id, None)
+        self.started_at.pop(guild_id, None)
+        self.discard_prefetched(guild_id)
+        self.ffmpeg_supervisor.kill_guild(guild_id, keep=self._get_process(current))
+        self.queue_store.mark_dirty(guild_id, playing=False)
+
+    @staticmethod
+    def _get_process(source: Optional[PlayableSource]):
+        """재생 소스의 FFmpeg 프로세스 (PCM 경로는 감싼 원본 소스에서 찾음)"""
+        inner = getattr(source, 'original', source)
+        return getattr(inner, '_process', None) or None
+
+    def release_guild_processes(self, guild_id: int):
+        """음성 연결이 끊긴 길드의 FFmpeg 프로세스 모두 종료"""
+        self.discard_prefetched(guild_id)
+        self.ffmpeg_supervisor.kill_guild(guild_id)
+
+    def get_queue_store_stats(self) -> Dict[str, int]:
+        """대기열 저장소 기록 통계"""
+        return self.queue_store.get_stats()
+
+    def get_ffmpeg_stats(self) -> Dict[str, int]:
+        """실행 중인 FFmpeg 프로세스 수와 메모리 사용량 (프로세스마다 /proc을 읽으므로 입출력 스레드에서 호출)"""
+        return self.ffmpeg_supervisor.get_stats()
+
+    def get_queue(self, guild_id: int) -> MusicQueue:
+        """현재 대기열 반환 (없으면 저장된 대기열을 복원하거나 새로 생성)"""
+        if guild_id not in self.queue:
+            self.queue[guild_id] = self._restore_queue(guild_id)
+        return self.queue[guild_id]
 
-    def get_queue(self, guild_id: int) -> List[YTDLPSource]:
-        """현재 대기열 반환"""
-        return self.queue.get(guild_id, [])
+    def _find_queue(self, guild_id: int) -> Optional[MusicQueue]:
+        """대기열 반환 (메모리에도 저장소에도 없으면 만들지 않고 None)"""
+        queue = self.queue.get(guild_id)
+        if queue is None and self.queue_store.has(guild_id):
+            queue = self.get_queue(guild_id)
+        return queue
 
-    def get_current(self, guild_id: int) -> Optional[YTDLPSource]:
+    def _restore_queue(self, guild_id: int) -> MusicQueue:
+        """저장된 대기열 복원 (재생 중이던 곡은 재생 위치와 함께 맨 앞에)"""
+        queue = MusicQueue()
+        if not self.queue_store.has(guild_id):
+            return queue
+
+        state = self.queue_store.load(guild_id)
+        if not state:
+            return queue
+        if state.get('current'):
+            track = Track.from_data(state['current'])
+            if track:
+                track.position = state.get('position')
+                queue.append(track)
+        queue.extend(track for track in map(Track.from_data, state.get('tracks', [])) if track)
+        return queue
+
+    def _snapshot_queue(self, guild_id: int) -> Optional[Dict[str, Any]]:
+        """저장할 대기열 상태 (비어 있으면 None으로 삭제)"""
+        queue = self.queue.get(guild_id)
+        tracks = [track.to_data() for track in queue] if queue else []
+        current = self.current.get(guild_id)
+        if not tracks and not current:
+            return None
+
+        state: Dict[str, Any] = {'tracks': tracks}
+        if current:
+            state['current'] = Track.from_data(current.data).to_data()
+            state['position'] = time.monotonic() - self.started_at.get(guild_id, time.monotonic())
+        return state
+
+    def get_current(self, guild_id: int) -> Optional[PlayableSource]:
         """현재 재생 중인 곡 정보 반환"""
         return self.current.get(guild_id)
 
-    def set_current(self, guild_id: int, source: YTDLPSource):
-        """현재 재생 중인 곡 설정"""
+    def set_current(self, guild_id: int, source: PlayableSource, position: float = 0.0):
+        """현재 재생 중인 곡 설정 (position: 곡 중간부터 재생할 때 시작 위치)"""
         self.current[guild_id] = source
+        self.started_at[guild_id] = time.monotonic() - position
+        self.queue_store.mark_dirty(guild_id, playing=True)
+
+    def clear_current(self, guild_id: int):
+        """재생할 곡이 더 없을 때 현재 곡 정보 제거"""
+        if self.current.pop(guild_id, None):
+            self.started_at.pop(guild_id, None)
+            self.queue_store.mark_dirty(guild_id, playing=False)
 
     def get_queue_length(self, guild_id: int) -> int:
         """대기열 길이 반환"""
-        return len(self.queue.get(guild_id, []))
+        queue = self._find_queue(guild_id)
+        return len(queue) if queue else 0
+
+    def get_remaining_duration(self, guild_id: int) -> int:
+        """대기열 전체 재생 시간 합계 (길이 정보가 없는 곡 제외)"""
+        queue = self._find_queue(guild_id)
+        return queue.total_duration if queue else 0
 
     async def get_estimated_time(self, guild_id: int, position: int) -> Optional[float]:
-        """특정 위치의 곡까지 예상 재생 시간 계산"""
-        if guild_id not in self.queue or position >= len(self.queue[guild_id]):
+        """특정 위치의 곡까지 예상 재생 시간 계산 (재생 시간 트리로 O(log n))"""
+        queue = self._find_queue(guild_id)
+        if not queue or position >= len(queue):
             return None
 
         total_time = 0
@@ -139,12 +614,17 @@ class MusicManager:
         if current and current.duration:
             total_time += current.duration
 
-        for i in range(position):
-            source = self.queue[guild_id][i]
-            if source.duration:
-                total_time += source.duration
+        known, _ = queue.duration_before(position)
+        return total_time + known
 
-        return total_time
+    def close(self):
+        """YoutubeDL 풀, 스레드 풀, FFmpeg 프로세스 정리"""
+        for pool in self.ytdl_pools.values():
+            pool.close()
+        for executor in self.executors.values():
+            executor.shutdown()
+        self.ffmpeg_supervisor.kill_all()
+        self.queue_store.close()
 
     async def cleanup(self, guild_id: int):
         """리소스 정리"""
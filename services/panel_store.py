@@ -0,0 +1,75 @@
+import json
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+from utils.files import write_json_atomic
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+
+class PanelStore:
+    """길드별 컨트롤 패널 위치(채널 ID, 메시지 ID)를 JSON 파일로 보관
+
+    재시작할 때 채널 기록을 뒤지지 않고 저장된 메시지 ID에 바로 뷰를 다시 연결하기 위해 사용한다.
+    """
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.panels: Dict[int, Tuple[int, int]] = {}
+        self.dirty = False
+        self._lock = threading.Lock()
+
+    def load(self):
+        """디스크에서 패널 위치 불러오기"""
+        if not self.path or not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("Error loading panel store", path=self.path, error=e)
+            return
+
+        with self._lock:
+            self.panels = {
+                int(guild_id): (entry['channel_id'], entry['message_id'])
+                for guild_id, entry in payload.items()
+            }
+
+    def get(self, guild_id: int) -> Optional[Tuple[int, int]]:
+        """(channel_id, message_id) 반환"""
+        return self.panels.get(guild_id)
+
+    def set(self, guild_id: int, channel_id: int, message_id: int):
+        with self._lock:
+            if self.panels.get(guild_id) != (channel_id, message_id):
+                self.panels[guild_id] = (channel_id, message_id)
+                self.dirty = True
+
+    def remove(self, guild_id: int):
+        with self._lock:
+            if self.panels.pop(guild_id, None):
+                self.dirty = True
+
+    def save(self):
+        """변경 사항을 디스크에 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self.path:
+            return
+
+        with self._lock:
+            if not self.dirty:
+                return
+            payload = {
+                str(guild_id): {'channel_id': channel_id, 'message_id': message_id}
+                for guild_id, (channel_id, message_id) in self.panels.items()
+            }
+            self.dirty = False
+
+        try:
+            write_json_atomic(self.path, payload)
+        except OSError as e:
+            self.dirty = True
+            logger.warning("Error saving panel store", path=self.path, error=e)
@@ -0,0 +1,133 @@
+import sys
+import time
+from typing import Any, Dict, Optional
+
+import discord
+
+from utils.metrics import MetricsRegistry, registry as default_registry
+
+# discord.py 음성 전송 스레드는 20ms마다 프레임 하나를 읽는다
+FRAME_DURATION = 0.02
+READ_LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100)
+# FFmpeg -reconnect 옵션으로 원격 스트림에 다시 연결할 때 출력하는 경고
+RECONNECT_MARKER = b'Will reconnect'
+
+
+class GuildPlaybackStats:
+    """길드별 재생 파이프라인 지표 (값은 공용 지표 저장소에 guild_id 라벨로 기록)"""
+
+    def __init__(self, guild_id: int, registry: MetricsRegistry = default_registry):
+        self.guild_id = guild_id
+        self.registry = registry
+        labels = {'guild_id': guild_id}
+        self.frames = registry.counter('playback_frames_total', **labels)
+        self.read_latency = registry.histogram('playback_read_latency_ms', READ_LATENCY_BUCKETS_MS, **labels)
+        self.underruns = registry.counter('playback_underruns_total', **labels)
+        self.first_frame = registry.stats('playback_first_frame_seconds', **labels)
+        self.ffmpeg_spawns = registry.counter('ffmpeg_spawns_total', **labels)
+        self.ffmpeg_reconnects = registry.counter('ffmpeg_reconnects_total', **labels)
+        self.ffmpeg_errors = registry.counter('ffmpeg_errors_total', **labels)
+        self.frames_per_second = 0.0
+        self._window_start: Optional[float] = None
+        self._window_frames = 0
+        self._last_read: Optional[float] = None
+
+    def record_spawn(self):
+        """FFmpeg 실행 기록"""
+        self.ffmpeg_spawns.inc()
+
+    def close(self):
+        """길드 라벨이 붙은 지표를 저장소에서 제거"""
+        self.registry.remove(guild_id=self.guild_id)
+
+    def record_read(self, latency: float, now: float):
+        """프레임 하나 읽기 기록 (재생 스레드에서 호출)
+
+        읽기에 프레임 길이(20ms)보다 오래 걸리면 전송이 밀리므로 언더런으로 집계한다.
+        """
+        self.frames.inc()
+        self.read_latency.observe(latency * 1000)
+        if latency > FRAME_DURATION:
+            self.underruns.inc()
+
+        # 1초 단위 구간으로 초당 프레임 수 계산
+        self._last_read = now
+        if self._window_start is None:
+            self._window_start = now
+        self._window_frames += 1
+        elapsed = now - self._window_start
+        if elapsed >= 1.0:
+            self.frames_per_second = self._window_frames / elapsed
+            self._window_start = now
+            self._window_frames = 0
+
+    def summary(self) -> Dict[str, Any]:
+        """/stats 표시용 요약"""
+        # 일시정지/정지 상태로 한동안 읽기가 없으면 0으로 표시
+        idle = self._last_read is None or time.perf_counter() - self._last_read > 2.0
+        return {
+            'frames': self.frames.value,
+            'frames_per_second': 0.0 if idle else self.frames_per_second,
+            'read_latency_ms': self.read_latency.summary(),
+            'underruns': self.underruns.value,
+            'first_frame': self.first_frame.summary(),
+            'ffmpeg_spawns': self.ffmpeg_spawns.value,
+            'ffmpeg_reconnects': self.ffmpeg_reconnects.value,
+            'ffmpeg_errors': self.ffmpeg_errors.value,
+        }
+
+
+class FFmpegStderrMonitor:
+    """FFmpeg stderr를 받아 재연결 횟수를 세고, 원래처럼 프로세스 stderr로 넘겨준다
+
+    discord.py는 fileno()가 없는 객체를 stderr로 받으면 별도 스레드에서 파이프를 읽어 write()를 호출한다.
+    SupervisedFFmpegMixin이 파이프를 줄 단위로 읽으므로 재연결은 곡이 끝나기 전에 바로 집계된다.
+    """
+
+    def __init__(self, stats: GuildPlaybackStats):
+        self.stats = stats
+        self._pending = b''
+
+    def write(self, data: bytes):
+        lines = (self._pending + data).split(b'\n')
+        self._pending = lines.pop()
+        for line in lines:
+            if RECONNECT_MARKER in line:
+                self.stats.ffmpeg_reconnects.inc()
+            sys.stderr.write(line.decode(errors='replace') + '\n')
+
+
+class MeteredSource(discord.AudioSource):
+    """재생 소스의 read()를 감싸 프레임 읽기 시간과 첫 프레임까지 걸린 시간을 기록
+
+    voice_client.play() 직전에 생성하므로 생성 시각부터 첫 프레임까지를 첫 프레임 지연으로 본다.
+    곡 정보 등 나머지 속성은 원래 소스로 넘긴다.
+    """
+
+    def __init__(self, source: discord.AudioSource, stats: GuildPlaybackStats):
+        self.original = source
+        self.stats = stats
+        self._created = time.perf_counter()
+        self._first_frame = True
+
+    def __getattr__(self, name: str):
+        if name == 'original':
+            raise AttributeError(name)
+        return getattr(self.original, name)
+
+    def read(self) -> bytes:
+        start = time.perf_counter()
+        data = self.original.read()
+        end = time.perf_counter()
+        if data:
+            if self._first_frame:
+                self._first_frame = False
+                self.stats.first_frame.add(end - self._created)
+            self.stats.record_read(end - start, end)
+        return data
+
+    def is_opus(self) -> bool:
+        return self.original.is_opus()
+
+    def cleanup(self):
+        self.original.cleanup()
@@ -0,0 +1,157 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+# guild_id -> 저장할 상태 (None이면 삭제)
+Snapshot = Optional[Dict[str, Any]]
+
+
+class QueueStore:
+    """길드별 대기열과 재생 중인 곡을 SQLite에 보관
+
+    대기열이 바뀔 때마다 바로 쓰지 않고 길드를 변경됨으로 표시만 해두고,
+    flush_interval마다 변경된 길드의 최신 상태만 한 트랜잭션으로 기록한다 (여러 번 바뀌어도 한 번만 기록).
+    SQLite 작업은 전용 스레드 하나에서만 실행해 이벤트 루프를 막지 않는다.
+    시작 시에는 저장된 길드 ID 목록만 읽고, 대기열 내용은 해당 길드에 처음 접근할 때 불러온다.
+    """
+
+    def __init__(self, path: Optional[str], snapshot: Callable[[int], Snapshot],
+                 flush_interval: float = 2.0, checkpoint_interval: float = 15.0):
+        self.path = path
+        self.snapshot = snapshot
+        self.flush_interval = flush_interval
+        self.checkpoint_interval = checkpoint_interval
+        self.stored: Set[int] = set()
+        self.dirty: Set[int] = set()
+        # 재생 중인 길드 (재생 위치가 계속 바뀌므로 checkpoint_interval마다 다시 기록)
+        self.active: Set[int] = set()
+        self._last_checkpoint = time.monotonic()
+        self.writes = 0
+        self.flushes = 0
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='queue-store')
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def open(self):
+        """DB를 열고 저장된 길드 ID 목록만 불러오기"""
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS queues ('
+                'guild_id INTEGER PRIMARY KEY, state TEXT NOT NULL, updated_at REAL NOT NULL)'
+            )
+            self._connection.commit()
+            self.stored = {row[0] for row in self._connection.execute('SELECT guild_id FROM queues')}
+        except sqlite3.Error as e:
+            logger.warning("Error opening queue store", path=self.path, error=e)
+            self._connection = None
+
+    def has(self, guild_id: int) -> bool:
+        """아직 불러오지 않은 저장 상태가 있는지 여부"""
+        return guild_id in self.stored
+
+    def load(self, guild_id: int) -> Snapshot:
+        """길드 상태 하나 불러오기 (기본 키 조회 한 번)"""
+        self.stored.discard(guild_id)
+        if self._connection is None:
+            return None
+        try:
+            with self._lock:
+                row = self._connection.execute(
+                    'SELECT state FROM queues WHERE guild_id = ?', (guild_id,)
+                ).fetchone()
+            return json.loads(row[0]) if row else None
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning("Error loading queue", guild_id=guild_id, error=e)
+            return None
+
+    def mark_dirty(self, guild_id: int, loop: Optional[asyncio.AbstractEventLoop] = None,
+                   playing: Optional[bool] = None):
+        """길드 상태가 바뀌었음을 표시하고, 예약된 기록이 없으면 예약 (playing으로 재생 여부 갱신)"""
+        if self._connection is None:
+            return
+        self.dirty.add(guild_id)
+        if playing is True:
+            self.active.add(guild_id)
+        elif playing is False:
+            self.active.discard(guild_id)
+        if self._flush_task is None or self._flush_task.done():
+            try:
+                loop = loop or asyncio.get_running_loop()
+            except RuntimeError:
+                # 이벤트 루프 밖에서 바뀐 상태는 다음 기록이나 종료 시 함께 저장
+                return
+            self._flush_task = loop.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        # 기록하는 동안 다시 바뀐 길드가 있거나 재생 중인 길드가 있으면 다음 주기에 이어서 기록
+        while self.dirty or self.active:
+            await asyncio.sleep(self.flush_interval)
+            now = time.monotonic()
+            if self.active and now - self._last_checkpoint >= self.checkpoint_interval:
+                self.dirty |= self.active
+                self._last_checkpoint = now
+            rows = self._collect()
+            if rows:
+                await asyncio.get_running_loop().run_in_executor(self._executor, self._write, rows)
+
+    def _collect(self) -> List[Tuple[int, Snapshot]]:
+        # 상태는 이벤트 루프에서 읽어 대기열이 바뀌는 도중의 값을 읽지 않도록 함
+        rows = [(guild_id, self.snapshot(guild_id)) for guild_id in self.dirty]
+        self.dirty.clear()
+        return rows
+
+    def _write(self, rows: List[Tuple[int, Snapshot]]):
+        now = time.time()
+        upserts = [(guild_id, json.dumps(state, ensure_ascii=False), now) for guild_id, state in rows if state]
+        deletes = [(guild_id,) for guild_id, state in rows if not state]
+        try:
+            with self._lock, self._connection:
+                if upserts:
+                    self._connection.executemany(
+                        'INSERT INTO queues (guild_id, state, updated_at) VALUES (?, ?, ?) '
+                        'ON CONFLICT(guild_id) DO UPDATE SET state = excluded.state, updated_at = excluded.updated_at',
+                        upserts
+                    )
+                if deletes:
+                    self._connection.executemany('DELETE FROM queues WHERE guild_id = ?', deletes)
+            self.writes += len(rows)
+            self.flushes += 1
+        except sqlite3.Error as e:
+            logger.warning("Error saving queues", guilds=len(rows), error=e)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            'pending': len(self.dirty),
+            'playing': len(self.active),
+            'unloaded': len(self.stored),
+            'writes': self.writes,
+            'flushes': self.flushes,
+        }
+
+    def close(self):
+        """남은 변경 사항을 기록하고 DB 닫기"""
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+        self._executor.shutdown(wait=True)
+        if self._connection is None:
+            return
+        rows = self._collect()
+        if rows:
+            self._write(rows)
+        self._connection.close()
+        self._connection = None
@@ -0,0 +1,87 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from services.metadata_cache import MetadataCache
+
+
+class SearchCache:
+    """검색 결과 메모리 캐시와 동일 검색 요청 병합
+
+    같은 검색어(정규화 기준)가 진행 중이면 새로 검색하지 않고 진행 중인 결과를 함께 기다린다.
+    """
+
+    def __init__(self, ttl: float = 60 * 60, max_entries: int = 500):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.results: 'OrderedDict[str, Tuple[float, Dict[str, Any]]]' = OrderedDict()
+        self.inflight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def get(self, query: str) -> Optional[Dict[str, Any]]:
+        """만료되지 않은 검색 결과 조회"""
+        key = MetadataCache.normalize_query(query)
+        cached = self.results.get(key)
+        if cached is None:
+            return None
+
+        expires_at, result = cached
+        if expires_at <= time.monotonic():
+            del self.results[key]
+            return None
+
+        self.results.move_to_end(key)
+        return result
+
+    def put(self, query: str, result: Dict[str, Any]):
+        """검색 결과 저장"""
+        key = MetadataCache.normalize_query(query)
+        self.results[key] = (time.monotonic() + self.ttl, result)
+        self.results.move_to_end(key)
+        while len(self.results) > self.max_entries:
+            self.results.popitem(last=False)
+
+    async def get_or_search(self, query: str,
+                            search: Callable[[], Awaitable[Optional[Dict[str, Any]]]]) -> Optional[Dict[str, Any]]:
+        """캐시 -> 진행 중인 동일 검색 -> 새 검색 순서로 결과 반환"""
+        result = self.get(query)
+        if result is not None:
+            self.hits += 1
+            return result
+
+        key = MetadataCache.normalize_query(query)
+        task = self.inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            # 검색 작업은 캐시가 소유하므로 먼저 요청한 쪽이 취소되어도 검색은 계속되고,
+            # 각 요청은 shield로 자기 대기만 취소한다
+            task = asyncio.ensure_future(self._search(query, key, search))
+            # 기다리는 요청이 모두 취소된 뒤 실패해도 '예외를 가져가지 않음' 경고가 나지 않도록 소비
+            task.add_done_callback(lambda done: done.cancelled() or done.exception())
+            self.inflight[key] = task
+        return await asyncio.shield(task)
+
+    async def _search(self, query: str, key: str,
+                      search: Callable[[], Awaitable[Optional[Dict[str, Any]]]]) -> Optional[Dict[str, Any]]:
+        try:
+            result = await search()
+            if result:
+                self.put(query, result)
+            return result
+        finally:
+            del self.inflight[key]
+
+    def get_stats(self) -> Dict[str, int]:
+        """검색 캐시 통계 반환"""
+        return {
+            'entries': len(self.results),
+            'inflight': len(self.inflight),
+            'hits': self.hits,
+            'misses': self.misses,
+            'coalesced': self.coalesced,
+        }
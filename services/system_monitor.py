@@ -0,0 +1,97 @@
+import asyncio
+import os
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+from utils.log import get_logger
+from utils.process import process_rss, psutil
+
+logger = get_logger(__name__)
+
+# 평균을 내는 항목 (None인 표본은 제외)
+AVERAGED_FIELDS = ('cpu_percent', 'process_cpu_percent', 'memory_percent', 'process_rss_bytes',
+                   'ffmpeg_processes', 'ffmpeg_rss_bytes')
+
+
+class SystemSampler:
+    """CPU/메모리/FFmpeg 사용량을 일정 간격으로 기록하는 링 버퍼
+
+    명령어 처리 중에 psutil.cpu_percent(interval=1)처럼 기다리지 않도록 백그라운드에서 미리 측정해 두고,
+    /status는 버퍼에서 최근 값과 1분/5분 평균을 바로 계산한다.
+    psutil이 없으면 프로세스 CPU 시간과 /proc 정보로 가능한 항목만 기록한다.
+    """
+
+    def __init__(self, interval: float = 5.0, history: float = 300.0,
+                 ffmpeg_stats: Optional[Callable[[], Dict[str, int]]] = None):
+        self.interval = interval
+        self.samples: Deque[Dict[str, Any]] = deque(maxlen=int(history / interval) + 1)
+        self.ffmpeg_stats = ffmpeg_stats
+        self._process = psutil.Process() if psutil is not None else None
+        self._last_times: Optional[tuple] = None
+        if psutil is not None:
+            # 첫 호출은 기준점만 잡고 0을 반환하므로 미리 한 번 호출
+            psutil.cpu_percent(interval=None)
+            self._process.cpu_percent(interval=None)
+
+    def _process_cpu_fallback(self, now: float) -> Optional[float]:
+        times = os.times()
+        used = times.user + times.system
+        previous, self._last_times = self._last_times, (now, used)
+        if previous is None or now <= previous[0]:
+            return None
+        return (used - previous[1]) / (now - previous[0]) * 100
+
+    def sample(self) -> Dict[str, Any]:
+        """현재 값 측정 (입출력 스레드에서 호출, 기다리지 않는 호출만 사용)"""
+        now = time.time()
+        sample: Dict[str, Any] = {'timestamp': now}
+        if psutil is not None:
+            sample['cpu_percent'] = psutil.cpu_percent(interval=None)
+            sample['memory_percent'] = psutil.virtual_memory().percent
+            sample['process_cpu_percent'] = self._process.cpu_percent(interval=None)
+            sample['process_rss_bytes'] = self._process.memory_info().rss
+        else:
+            sample['cpu_percent'] = None
+            sample['memory_percent'] = None
+            sample['process_cpu_percent'] = self._process_cpu_fallback(now)
+            sample['process_rss_bytes'] = process_rss()
+
+        if self.ffmpeg_stats:
+            ffmpeg = self.ffmpeg_stats()
+            sample['ffmpeg_processes'] = ffmpeg['live']
+            sample['ffmpeg_rss_bytes'] = ffmpeg['rss_bytes']
+        return sample
+
+    async def run(self, run_io: Callable[[Callable[[], Any]], Awaitable[Any]]):
+        """interval마다 측정해 버퍼에 추가"""
+        while True:
+            try:
+                self.samples.append(await run_io(self.sample))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Error sampling system metrics", error=e)
+            await asyncio.sleep(self.interval)
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        return self.samples[-1] if self.samples else None
+
+    def average(self, seconds: float) -> Dict[str, Optional[float]]:
+        """최근 seconds초 동안의 항목별 평균"""
+        since = time.time() - seconds
+        recent = [sample for sample in reversed(self.samples) if sample['timestamp'] >= since]
+        averages: Dict[str, Optional[float]] = {}
+        for field in AVERAGED_FIELDS:
+            values = [sample[field] for sample in recent if sample.get(field) is not None]
+            averages[field] = sum(values) / len(values) if values else None
+        return averages
+
+    def summary(self) -> Dict[str, Any]:
+        """/status 표시용 (최근 값, 1분/5분 평균)"""
+        return {
+            'latest': self.latest(),
+            '1m': self.average(60),
+            '5m': self.average(300),
+            'psutil': psutil is not None,
+        }
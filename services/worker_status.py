@@ -0,0 +1,81 @@
+import asyncio
+import json
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+from utils.files import write_json_atomic
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+
+class WorkerStatusBoard:
+    """워커 프로세스끼리 상태를 공유하는 파일 기반 게시판
+
+    워커마다 주기적으로 자기 상태를 status_dir/worker-<id>.json에 기록하고(임시 파일에 쓴 뒤 교체),
+    /status는 모든 파일을 읽어 합산한다. 별도 서버나 소켓 없이 같은 호스트의 워커끼리만 사용한다.
+    """
+
+    def __init__(self, directory: str, worker_id: int, interval: float = 5.0, stale_after: float = 30.0):
+        self.directory = directory
+        self.worker_id = worker_id
+        self.interval = interval
+        self.stale_after = stale_after
+
+    def _path(self, worker_id: int) -> str:
+        return os.path.join(self.directory, f"worker-{worker_id}.json")
+
+    def publish(self, status: Dict[str, Any]):
+        """자기 상태 기록"""
+        try:
+            write_json_atomic(self._path(self.worker_id), {**status, 'updated_at': time.time()})
+        except OSError as e:
+            logger.warning("Error publishing worker status", worker_id=self.worker_id, error=e)
+
+    def read_all(self) -> List[Dict[str, Any]]:
+        """모든 워커의 최근 상태 (stale_after초 넘게 갱신되지 않은 워커는 제외)"""
+        statuses = []
+        now = time.time()
+        try:
+            entries = list(os.scandir(self.directory))
+        except OSError:
+            return statuses
+        for entry in entries:
+            if not (entry.name.startswith('worker-') and entry.name.endswith('.json')):
+                continue
+            try:
+                with open(entry.path, 'r', encoding='utf-8') as f:
+                    status = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if now - status.get('updated_at', 0) <= self.stale_after:
+                statuses.append(status)
+        return sorted(statuses, key=lambda status: status.get('worker_id', 0))
+
+    async def run(self, collect: Callable[[], Dict[str, Any]],
+                  run_io: Callable[[Callable[[], Any]], Awaitable[Any]]):
+        """interval마다 상태 기록 (상태 수집은 이벤트 루프에서, 파일 쓰기는 run_io로 입출력 스레드에서)"""
+        while True:
+            status = collect()
+            await run_io(lambda: self.publish(status))
+            await asyncio.sleep(self.interval)
+
+    def remove(self):
+        """종료 시 자기 상태 파일 제거"""
+        try:
+            os.remove(self._path(self.worker_id))
+        except OSError:
+            pass
+
+
+def aggregate_status(statuses: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """워커 상태 합산"""
+    totals: Dict[str, Any] = {'workers': len(statuses)}
+    for key in ('guilds', 'voice_clients', 'playing', 'queued_tracks',
+                'ffmpeg_processes', 'ffmpeg_rss_bytes', 'process_rss_bytes'):
+        totals[key] = sum(status.get(key, 0) for status in statuses)
+    latencies = [status['latency_ms'] for status in statuses if status.get('latency_ms') is not None]
+    totals['latency_ms'] = max(latencies) if latencies else None
+    return totals
+
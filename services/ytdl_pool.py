@@ -0,0 +1,81 @@
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator
+
+import yt_dlp
+
+
+class YoutubeDLPool:
+    """옵션 프로필 하나에 대한 YoutubeDL 인스턴스 풀
+
+    인스턴스 생성 시 옵션 파싱과 추출기/HTTP 초기화 비용이 크므로 미리 만든 인스턴스를 재사용한다.
+    한 인스턴스는 한 번에 한 스레드만 사용하도록 체크아웃/반납 방식으로 관리한다.
+    """
+
+    def __init__(self, options: Dict[str, Any], size: int,
+                 factory: Callable[[Dict[str, Any]], Any] = yt_dlp.YoutubeDL):
+        self.options = options
+        self.size = max(1, size)
+        self.factory = factory
+        # 최근에 반납된(가장 따뜻한) 인스턴스부터 재사용
+        self._idle: 'queue.LifoQueue' = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            create = self._created < self.size
+            if create:
+                self._created += 1
+
+        if create:
+            try:
+                return self.factory(dict(self.options))
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+
+        # 풀이 가득 찼으면 다른 스레드가 반납할 때까지 대기
+        return self._idle.get()
+
+    @contextmanager
+    def checkout(self) -> Iterator[Any]:
+        """인스턴스를 빌려 쓰고 반납"""
+        ydl = self._acquire()
+        try:
+            yield ydl
+        finally:
+            self._idle.put(ydl)
+
+    def extract_info(self, url: str, **kwargs) -> Any:
+        """풀의 인스턴스로 extract_info 실행 (executor 스레드에서 호출)"""
+        with self.checkout() as ydl:
+            return ydl.extract_info(url, **kwargs)
+
+    def warm_up(self, count: int):
+        """인스턴스를 미리 생성"""
+        created = []
+        for _ in range(min(count, self.size)):
+            created.append(self._acquire())
+        for ydl in created:
+            self._idle.put(ydl)
+
+    def close(self):
+        """유휴 인스턴스 정리"""
+        while True:
+            try:
+                ydl = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            close = getattr(ydl, 'close', None)
+            if close:
+                close()
+            with self._lock:
+                self._created -= 1
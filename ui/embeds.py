@@ -1,9 +1,10 @@
 import discord
 from datetime import datetime
+from typing import Optional
 
 class MusicEmbeds:
     @staticmethod
-    def create_now_playing_embed(source: 'YTDLPSource') -> discord.Embed:
+    async def create_now_playing_embed(source: 'YTDLPSource') -> discord.Embed:
         embed = discord.Embed(
             title="현재 재생 중",
             description=f"[{source.title}]({source.webpage_url})",
@@ -11,4 +12,245 @@ class MusicEmbeds:
         )
         if source.thumbnail:
             embed.set_thumbnail(url=source.thumbnail)
-        return embed
\ No newline at end of file
+        return embed
+
+    @staticmethod
+    async def create_control_panel_embed() -> discord.Embed:
+        embed = discord.Embed(
+            title="알로롱 - 음악채널",
+            description="아래 버튼을 눌러 음악 봇을 제어할 수 있습니다.",
+            color=discord.Color.blue()
+        )
+        embed.add_field(
+            name="99.9%의 업타임 보장 🚀",
+            value="봇 재시작 시에도 음악이 끊기지 않으며, 음질과 최적화를 위해 데일리 업데이트를 제공합니다.",
+            inline=False
+        )
+        embed.add_field(
+            name="최적의 사용자 편의를 제공하는 UI 🎯",
+            value="유저가 친숙한 편하게 최소한의 동작으로 기능을 사용할 수 있도록 설계했습니다.",
+            inline=False
+        )
+        embed.add_field(
+            name="호환성부터 보장된 고품질 서비스를 유지합니다 ❤️",
+            value="주원자분들의 지원으로 모든 유저가 무료로 최상의 기능을 누릴 수 있습니다. 작은 후원도 큰 힘이 됩니다.",
+            inline=False
+        )
+        return embed
+
+    @staticmethod
+    def format_duration(seconds: Optional[float]) -> str:
+        if seconds is None:
+            return "길이 정보 없음"
+        seconds = int(seconds)
+        if seconds >= 3600:
+            return f"{seconds // 3600}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+        return f"{seconds // 60}:{seconds % 60:02d}"
+
+    @staticmethod
+    async def create_queue_embed(queue: 'MusicQueue', current: Optional['YTDLPSource'],
+                                 limit: int = 10) -> discord.Embed:
+        embed = discord.Embed(
+            title="재생 대기열",
+            description=f"다음 {len(queue)}개의 곡이 대기 중입니다.",
+            color=discord.Color.blue()
+        )
+        if current:
+            embed.add_field(
+                name="현재 재생 중",
+                value=f"[{current.title}]({current.webpage_url})",
+                inline=False
+            )
+
+        # 대기 시간은 대기열의 재생 시간 트리로 곡마다 O(log n)에 계산
+        current_duration = current.duration if current and current.duration else 0
+        current_unknown = 1 if current and not current.duration else 0
+        for i, track in enumerate(queue[:limit]):
+            known, unknown = queue.duration_before(i)
+            wait = MusicEmbeds.format_duration(current_duration + known)
+            if unknown + current_unknown:
+                wait += "+"
+            embed.add_field(
+                name=f"{i + 1}. {track.title}",
+                value=f"길이: {MusicEmbeds.format_duration(track.duration)} · 예상 대기: {wait}",
+                inline=False
+            )
+
+        footer = f"전체 길이: {MusicEmbeds.format_duration(queue.total_duration)}"
+        if len(queue) > limit:
+            footer = f"외 {len(queue) - limit}개의 곡 · {footer}"
+        embed.set_footer(text=footer)
+        return embed
+
+    @staticmethod
+    def _format_seconds(value: Optional[float]) -> str:
+        return f"{value * 1000:.0f}ms" if value is not None else "-"
+
+    @staticmethod
+    async def create_stats_embed(playback: dict, gap: dict, cache: dict,
+                                 processes: Optional[dict] = None,
+                                 executors: Optional[dict] = None) -> discord.Embed:
+        embed = discord.Embed(title="재생 통계", color=discord.Color.blue())
+
+        latency = playback['read_latency_ms']
+        avg_latency = f"{latency['avg']:.2f}ms" if latency['avg'] is not None else "-"
+        embed.add_field(
+            name="프레임",
+            value=(f"초당 {playback['frames_per_second']:.1f}프레임 · 누적 {playback['frames']:,}\n"
+                   f"평균 읽기 시간 {avg_latency} · 언더런 {playback['underruns']}회"),
+            inline=False
+        )
+        histogram = " ".join(f"`{bucket}ms` {count}" for bucket, count in latency['buckets'].items() if count)
+        embed.add_field(name="읽기 시간 분포", value=histogram or "-", inline=False)
+
+        first_frame = playback['first_frame']
+        embed.add_field(
+            name="첫 프레임 / 곡 전환",
+            value=(f"첫 프레임 p50 {MusicEmbeds._format_seconds(first_frame['p50'])} · "
+                   f"p95 {MusicEmbeds._format_seconds(first_frame['p95'])}\n"
+                   f"전환 공백 p50 {MusicEmbeds._format_seconds(gap['p50'])} · "
+                   f"p95 {MusicEmbeds._format_seconds(gap['p95'])}"),
+            inline=False
+        )
+        embed.add_field(
+            name="FFmpeg",
+            value=(f"실행 {playback['ffmpeg_spawns']} · 재연결 {playback['ffmpeg_reconnects']} · "
+                   f"오류 {playback['ffmpeg_errors']}"),
+            inline=False
+        )
+        if processes:
+            embed.add_field(
+                name="FFmpeg 프로세스 (전체)",
+                value=(f"실행 중 {processes['live']}/{processes['max']} · "
+                       f"메모리 {processes['rss_bytes'] / 1024 / 1024:.1f}MB · "
+                       f"한도 초과 {processes['rejected']} · 강제 종료 {processes['killed']}"),
+                inline=False
+            )
+        if executors:
+            embed.add_field(
+                name="작업 대기열",
+                value="\n".join(
+                    f"{name}: 실행 {stats['in_flight']}/{stats['workers']} · 대기 {stats['depth']} · "
+                    f"대기 시간 p95 {MusicEmbeds._format_seconds(stats['wait']['p95'])}"
+                    for name, stats in executors.items()
+                ),
+                inline=False
+            )
+        embed.add_field(
+            name="캐시",
+            value="\n".join(
+                f"{name}: 적중 {stats.get('hits', 0)} · 실패 {stats.get('misses', 0)}"
+                for name, stats in cache.items()
+            ),
+            inline=False
+        )
+        return embed
+
+    @staticmethod
+    async def create_loop_lag_embed(summary: dict, offenders: list, stack_lines: int = 6) -> discord.Embed:
+        embed = discord.Embed(title="이벤트 루프 지연", color=discord.Color.blue())
+        lag = summary['lag']
+        embed.add_field(
+            name="지연",
+            value=(f"최근 {MusicEmbeds._format_seconds(lag['last'])} · p50 {MusicEmbeds._format_seconds(lag['p50'])} · "
+                   f"p95 {MusicEmbeds._format_seconds(lag['p95'])} · 최대 {MusicEmbeds._format_seconds(lag['max'])}\n"
+                   f"{summary['threshold'] * 1000:.0f}ms 넘게 막힌 횟수 {summary['stalls']}회"),
+            inline=False
+        )
+        histogram = " ".join(f"`{bucket}ms` {count}" for bucket, count in summary['buckets'].items() if count)
+        embed.add_field(name="지연 분포", value=histogram or "-", inline=False)
+
+        for rank, offender in enumerate(offenders, 1):
+            # 스택은 안쪽 프레임 몇 줄만 표시 (필드 길이 제한 1024자)
+            stack = "".join(offender['stack'].splitlines(keepends=True)[-stack_lines * 2:])[-900:]
+            embed.add_field(
+                name=f"{rank}. {offender['location']}"[:256],
+                value=(f"{offender['count']}회 · 최대 {MusicEmbeds._format_seconds(offender['max'])} · "
+                       f"합계 {MusicEmbeds._format_seconds(offender['total'])}\n```{stack}```"),
+                inline=False
+            )
+        if not offenders:
+            embed.add_field(name="루프를 오래 막은 작업", value="없음", inline=False)
+        return embed
+
+    @staticmethod
+    def _format_system(system: dict) -> str:
+        def percent(value) -> str:
+            return f"{value:.0f}%" if value is not None else "-"
+
+        def megabytes(value) -> str:
+            return f"{value / 1024 / 1024:.0f}MB" if value is not None else "-"
+
+        rows = [
+            ("CPU (전체)", 'cpu_percent', percent),
+            ("CPU (봇)", 'process_cpu_percent', percent),
+            ("메모리 (전체)", 'memory_percent', percent),
+            ("메모리 (봇)", 'process_rss_bytes', megabytes),
+            ("메모리 (FFmpeg)", 'ffmpeg_rss_bytes', megabytes),
+        ]
+        lines = []
+        for label, key, fmt in rows:
+            if system['latest'].get(key) is None:
+                continue
+            lines.append(f"{label}: {fmt(system['latest'][key])} / {fmt(system['1m'][key])} / {fmt(system['5m'][key])}")
+        return "\n".join(lines) or "-"
+
+    @staticmethod
+    async def create_status_embed(totals: dict, workers: list, system: Optional[dict] = None) -> discord.Embed:
+        embed = discord.Embed(title="봇 상태", color=discord.Color.blue())
+        latency = f"{totals['latency_ms']:.0f}ms" if totals['latency_ms'] is not None else "-"
+        embed.add_field(
+            name="전체",
+            value=(f"서버 {totals['guilds']}개 · 음성 연결 {totals['voice_clients']}개 · "
+                   f"재생 중 {totals['playing']}개\n"
+                   f"대기 중인 곡 {totals['queued_tracks']}개 · 최대 지연 {latency}"),
+            inline=False
+        )
+        embed.add_field(
+            name="FFmpeg",
+            value=(f"프로세스 {totals['ffmpeg_processes']}개 · "
+                   f"메모리 {totals['ffmpeg_rss_bytes'] / 1024 / 1024:.1f}MB"),
+            inline=False
+        )
+        if system and system['latest']:
+            embed.add_field(name="시스템 (현재 / 1분 / 5분 평균)", value=MusicEmbeds._format_system(system),
+                            inline=False)
+        if totals['workers'] > 1:
+            lines = []
+            for status in workers:
+                shards = status.get('shard_ids') or []
+                shard_text = f"샤드 {shards[0]}-{shards[-1]}" if shards else "샤드 -"
+                lines.append(
+                    f"#{status['worker_id']} {shard_text} · 서버 {status['guilds']} · "
+                    f"음성 {status['voice_clients']} · 재생 {status['playing']}"
+                )
+            embed.add_field(name=f"워커 {totals['workers']}개", value="\n".join(lines), inline=False)
+        return embed
+
+    @staticmethod
+    async def create_version_embed(release: Optional[dict], current_version: str, repo_url: str,
+                                   limit: int = 1024) -> discord.Embed:
+        version = release['version'] if release else current_version
+        embed = discord.Embed(
+            title="디스코드 봇 버전 정보",
+            description=f"현재 버전: v{current_version}" + (
+                f"\n조회한 버전: v{version}" if version != current_version else ""),
+            color=discord.Color.blue()
+        )
+        if repo_url:
+            changelog_url = f"{repo_url}/blob/main/CHANGELOG.md"
+            embed.add_field(name="릴리즈 노트", value=f"[v{version} 릴리즈 노트 보기]({changelog_url})", inline=False)
+
+        if release and release['sections']:
+            lines = []
+            for name, items in release['sections'].items():
+                lines.append(f"> {name}")
+                lines.extend(f"* {item}" for item in items)
+            notes = "\n".join(lines)
+            if len(notes) > limit:
+                notes = notes[:limit - 3] + "..."
+            embed.add_field(name="변경사항", value=notes, inline=False)
+
+        date = release.get('date') if release else None
+        embed.set_footer(text=f"업데이트: {date}" if date else "업데이트 날짜 정보 없음")
+        return embed
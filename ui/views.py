@@ -2,11 +2,13 @@ import discord
 from discord.ui import View, Button
 
 class MusicControlView(discord.ui.View):
+    """음악 채널 컨트롤 패널 (재시작 후에도 버튼이 동작하도록 custom_id를 고정한 영구 뷰)"""
     def __init__(self, bot):
         super().__init__(timeout=None)
         self.bot = bot
 
-    @discord.ui.button(label="대기열", style=discord.ButtonStyle.primary, emoji="📋")
+    @discord.ui.button(label="대기열", style=discord.ButtonStyle.primary, emoji="📋",
+                       custom_id="music_panel:queue")
     async def queue_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         music_bot = self.bot.get_cog('MusicBot')
         await music_bot.show_queue(interaction)
@@ -0,0 +1,110 @@
+import array
+import sys
+import warnings
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', DeprecationWarning)
+        import audioop
+except ImportError:
+    # Python 3.13부터 audioop 제거
+    audioop = None
+
+
+# discord.py PCM 프레임: 48kHz, 16비트, 스테레오, 20ms
+CHANNELS = 2
+SAMPLES_PER_FRAME = 960
+FRAME_SIZE = SAMPLES_PER_FRAME * CHANNELS * 2
+MAX_GAIN = 2.0
+
+
+class GainStage:
+    """16비트 스테레오 PCM 프레임 볼륨 조절
+
+    numpy가 있으면 프레임 버퍼를 int16 배열로 그대로 보고(복사 없이) 미리 잡아둔 버퍼에서 계산한다.
+    볼륨이 바뀌면 ramp_frames 프레임에 걸쳐 선형으로 변화시켜 클릭 잡음을 막고,
+    볼륨이 1.0이면 프레임을 손대지 않고 그대로 반환한다.
+    """
+
+    def __init__(self, gain: float = 1.0, ramp_frames: int = 5):
+        self.gain = self.target = self._clamp(gain)
+        self.ramp_frames = max(1, ramp_frames)
+        self._step = 0.0
+        if np is not None:
+            self._work = np.empty(SAMPLES_PER_FRAME * CHANNELS, dtype=np.float32)
+            self._gains = np.empty(SAMPLES_PER_FRAME * CHANNELS, dtype=np.float32)
+            self._out = np.empty(SAMPLES_PER_FRAME * CHANNELS, dtype=np.int16)
+            # 프레임 안에서의 위치(0~1)를 샘플(좌/우 채널 동일)마다 미리 계산
+            self._ramp = np.repeat(
+                np.arange(SAMPLES_PER_FRAME, dtype=np.float32) / SAMPLES_PER_FRAME, CHANNELS
+            )
+
+    @staticmethod
+    def _clamp(gain: float) -> float:
+        return max(0.0, min(float(gain), MAX_GAIN))
+
+    def set_gain(self, gain: float):
+        """목표 볼륨 설정 (ramp_frames 프레임에 걸쳐 도달)"""
+        self.target = self._clamp(gain)
+        self._step = (self.target - self.gain) / self.ramp_frames
+
+    def process(self, frame: bytes) -> bytes:
+        """프레임 하나에 볼륨 적용"""
+        start = self.gain
+        end = self.target
+        if start != end:
+            end = start + self._step
+            if (self._step > 0 and end >= self.target) or (self._step < 0 and end <= self.target):
+                end = self.target
+            self.gain = end
+
+        # 볼륨 1.0 고정이면 계산 생략
+        if start == end == 1.0 or not frame:
+            return frame
+
+        if np is not None and len(frame) == FRAME_SIZE:
+            return self._process_numpy(frame, start, end)
+        return self._process_fallback(frame, start, end)
+
+    def _process_numpy(self, frame: bytes, start: float, end: float) -> bytes:
+        samples = np.frombuffer(frame, dtype=np.int16)
+        if start == end:
+            np.multiply(samples, start, out=self._work)
+        else:
+            np.multiply(self._ramp, end - start, out=self._gains)
+            self._gains += start
+            np.multiply(samples, self._gains, out=self._work)
+        # 1.0 이하 볼륨은 범위를 넘을 수 없으므로 클리핑 생략
+        if max(start, end) > 1.0:
+            np.clip(self._work, -32768, 32767, out=self._work)
+        self._out[:] = self._work
+        return self._out.tobytes()
+
+    @staticmethod
+    def _process_fallback(frame: bytes, start: float, end: float) -> bytes:
+        if start == end and audioop is not None:
+            return audioop.mul(frame, 2, start)
+
+        samples = array.array('h')
+        samples.frombytes(frame)
+        if sys.byteorder == 'big':
+            samples.byteswap()
+        count = len(samples)
+        delta = end - start
+        for i in range(count):
+            gain = start + delta * (i // CHANNELS) / (count // CHANNELS)
+            samples[i] = max(-32768, min(32767, int(samples[i] * gain)))
+        if sys.byteorder == 'big':
+            samples.byteswap()
+        return samples.tobytes()
+
+
+def numpy_available() -> bool:
+    """numpy 가속 경로 사용 가능 여부"""
+    return np is not None
+
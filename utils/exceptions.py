@@ -3,4 +3,8 @@ class VoiceConnectionError:
 
 
 class MusicSourceError(Exception):
-    pass
\ No newline at end of file
+    pass
+
+
+class FFmpegLimitError(MusicSourceError):
+    pass
@@ -0,0 +1,12 @@
+import json
+import os
+from typing import Any
+
+
+def write_json_atomic(path: str, payload: Any, **dump_kwargs):
+    """JSON을 임시 파일에 쓴 뒤 교체 (쓰는 도중 종료되어도 이전 파일이 깨지지 않음, OSError는 호출한 쪽에서 처리)"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, **dump_kwargs)
+    os.replace(tmp_path, path)
@@ -0,0 +1,180 @@
+import atexit
+import copy
+import json
+import logging
+import queue
+import random
+import sys
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, MutableMapping, Optional, Tuple
+
+# logging.Logger.log이 직접 받는 인자 (나머지 키워드 인자는 구조화 필드로 취급)
+LOG_KWARGS = ('exc_info', 'stack_info', 'stacklevel', 'extra')
+
+_listener: Optional[QueueListener] = None
+
+
+class StructuredLogger(logging.LoggerAdapter):
+    """키워드 인자를 구조화 필드로 붙이는 로거
+
+        logger.warning("Error creating source", guild_id=guild_id, query=query, error=e)
+        logger.debug("yt-dlp info", sample=0.1, payload=lambda: json.dumps(data))
+
+    레벨이 꺼져 있으면 필드를 만들기 전에 바로 반환하고, 호출 가능한 필드 값은 호출하지 않은 채 넘겨
+    RateLimitFilter를 통과한 레코드만 리스너 스레드의 StructuredFormatter가 호출한다.
+    따라서 큰 페이로드 덤프도 람다로 넘기면 비활성화되거나 막힌 로그는 비용이 없고, 기록할 때도
+    이벤트 루프를 막지 않는다 (람다는 다른 스레드에서 나중에 실행되므로 이후에 바뀌지 않는 값만 참조해야 한다).
+    sample(0~1)을 주면 그 비율만큼만 기록한다 (자주 발생하는 디버그 로그용).
+    """
+
+    def __init__(self, logger: logging.Logger):
+        super().__init__(logger, {})
+
+    def log(self, level: int, msg: Any, *args, sample: Optional[float] = None, **kwargs):
+        if not self.isEnabledFor(level):
+            return
+        if sample is not None and random.random() >= sample:
+            return
+        msg, kwargs = self.process(msg, kwargs)
+        self.logger.log(level, msg, *args, **kwargs)
+
+    def process(self, msg: Any, kwargs: MutableMapping[str, Any]) -> Tuple[Any, MutableMapping[str, Any]]:
+        fields = {key: value for key, value in kwargs.items() if key not in LOG_KWARGS}
+        log_kwargs = {key: kwargs[key] for key in LOG_KWARGS if key in kwargs}
+        if fields:
+            log_kwargs['extra'] = {**log_kwargs.get('extra', {}), 'fields': fields}
+        return msg, log_kwargs
+
+
+def get_logger(name: str) -> StructuredLogger:
+    return StructuredLogger(logging.getLogger(name))
+
+
+class RateLimitFilter(logging.Filter):
+    """같은 메시지(로거 + 메시지 템플릿)는 window초에 burst번까지만 통과
+
+    막힌 횟수는 다음에 통과하는 같은 메시지의 suppressed 필드로 붙인다.
+    대기열에 넣기 전에 거르므로 오류가 폭주해도 이벤트 루프와 로그 스레드의 부담이 늘지 않는다.
+    """
+
+    def __init__(self, burst: int = 5, window: float = 10.0):
+        super().__init__()
+        self.burst = burst
+        self.window = window
+        # (로거, 레벨, 템플릿) -> [구간 시작 시각, 구간 내 통과 수, 막힌 수]
+        self._counts: Dict[Tuple[str, int, Any], list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.burst <= 0:
+            return True
+        key = (record.name, record.levelno, record.msg)
+        now = time.monotonic()
+        with self._lock:
+            state = self._counts.get(key)
+            if state is None or now - state[0] >= self.window:
+                suppressed = state[2] if state else 0
+                state = self._counts[key] = [now, 0, 0]
+            else:
+                suppressed = 0
+            if state[1] >= self.burst:
+                state[2] += 1
+                return False
+            state[1] += 1
+        if suppressed:
+            record.fields = {**getattr(record, 'fields', {}), 'suppressed': suppressed}
+        return True
+
+
+class AsyncQueueHandler(QueueHandler):
+    """메시지 조립과 출력은 리스너 스레드에서 하도록 레코드를 그대로 대기열에 넣는 핸들러
+
+    기본 QueueHandler.prepare는 호출한 스레드(이벤트 루프)에서 포맷까지 끝내므로,
+    같은 프로세스 안의 대기열만 쓰는 여기서는 레코드 복사만 한다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return copy.copy(record)
+
+
+class StructuredFormatter(logging.Formatter):
+    """구조화 필드를 key=value(text) 또는 한 줄 JSON(json)으로 출력 (호출 가능한 필드 값은 여기서 호출)"""
+
+    def __init__(self, json_format: bool = False):
+        super().__init__('%(asctime)s %(levelname)s %(name)s: %(message)s')
+        self.json_format = json_format
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = {
+            key: value() if callable(value) else value
+            for key, value in getattr(record, 'fields', {}).items()
+        }
+        if self.json_format:
+            payload = {
+                'time': record.created,
+                'level': record.levelname,
+                'logger': record.name,
+                'message': record.getMessage(),
+                **{key: self._jsonable(value) for key, value in fields.items()},
+            }
+            if record.exc_info:
+                payload['exc_info'] = self.formatException(record.exc_info)
+            return json.dumps(payload, ensure_ascii=False)
+
+        # 필드는 메시지 첫 줄 끝에 붙이고, 나머지 줄과 예외/스택 정보는 그 아래에 출력
+        record.message, _, detail = record.getMessage().partition('\n')
+        record.asctime = self.formatTime(record, self.datefmt)
+        text = self.formatMessage(record)
+        if fields:
+            text += ' ' + ' '.join(f"{key}={self._format_value(value)}" for key, value in fields.items())
+        if detail:
+            text += '\n' + detail
+        if record.exc_info:
+            text += '\n' + self.formatException(record.exc_info)
+        if record.stack_info:
+            text += '\n' + self.formatStack(record.stack_info)
+        return text
+
+    @staticmethod
+    def _format_value(value: Any) -> str:
+        if isinstance(value, float):
+            return f"{value:.3f}"
+        text = f"{type(value).__name__}: {value}" if isinstance(value, BaseException) else str(value)
+        if not text or ' ' in text or '\n' in text or '"' in text:
+            return json.dumps(text, ensure_ascii=False)
+        return text
+
+    @staticmethod
+    def _jsonable(value: Any) -> Any:
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        if isinstance(value, BaseException):
+            return f"{type(value).__name__}: {value}"
+        return str(value)
+
+
+def setup_logging(level: str = 'INFO', json_format: bool = False,
+                  rate_burst: int = 5, rate_window: float = 10.0) -> QueueListener:
+    """루트 로거에 대기열 핸들러를 달고, 표준 에러 출력은 리스너 스레드에서 처리 (프로세스당 한 번)"""
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    handler = AsyncQueueHandler(log_queue)
+    handler.addFilter(RateLimitFilter(rate_burst, rate_window))
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(StructuredFormatter(json_format))
+
+    root = logging.getLogger()
+    root.setLevel(level.upper())
+    root.addHandler(handler)
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    # 종료 시 대기열에 남은 로그를 마저 출력
+    atexit.register(_listener.stop)
+    return _listener
@@ -0,0 +1,125 @@
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Sequence, Tuple
+
+
+class RollingStats:
+    """최근 측정값을 보관하고 평균/백분위수를 계산"""
+
+    def __init__(self, size: int = 256):
+        self.samples: Deque[float] = deque(maxlen=size)
+        self.count = 0
+        self.last: Optional[float] = None
+
+    def add(self, value: float):
+        """측정값 추가"""
+        self.samples.append(value)
+        self.count += 1
+        self.last = value
+
+    def percentile(self, p: float) -> Optional[float]:
+        """보관 중인 측정값의 백분위수 (p: 0~100)"""
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        """요약 통계 반환"""
+        if not self.samples:
+            return {'count': self.count, 'last': None, 'avg': None, 'p50': None, 'p95': None, 'max': None}
+        return {
+            'count': self.count,
+            'last': self.last,
+            'avg': sum(self.samples) / len(self.samples),
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'max': max(self.samples),
+        }
+
+
+class Counter:
+    """누적 카운터"""
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: int = 1):
+        self.value += amount
+
+
+class Histogram:
+    """구간별 누적 히스토그램 (buckets는 각 구간의 상한, 마지막 구간은 무한대)"""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.count += 1
+        self.total += value
+
+    def summary(self) -> Dict[str, Any]:
+        labels = [f"<={bound:g}" for bound in self.buckets] + [f">{self.buckets[-1]:g}" if self.buckets else "all"]
+        return {
+            'count': self.count,
+            'avg': self.total / self.count if self.count else None,
+            'buckets': dict(zip(labels, self.counts)),
+        }
+
+
+class MetricsRegistry:
+    """프로세스 내 지표 저장소 (이름 + 라벨 조합별로 지표 하나)
+
+    재생 스레드에서 값이 갱신되므로 지표 생성만 잠그고, 값 갱신은 잠그지 않는다 (근사값 허용).
+    """
+
+    def __init__(self):
+        self._metrics: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Any] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, name: str, labels: Dict[str, Any], factory):
+        key = (name, tuple(sorted(labels.items())))
+        metric = self._metrics.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.setdefault(key, factory())
+        return metric
+
+    def counter(self, name: str, **labels) -> Counter:
+        return self._get(name, labels, Counter)
+
+    def histogram(self, name: str, buckets: Sequence[float], **labels) -> Histogram:
+        return self._get(name, labels, lambda: Histogram(buckets))
+
+    def stats(self, name: str, **labels) -> RollingStats:
+        return self._get(name, labels, RollingStats)
+
+    def remove(self, **labels):
+        """특정 라벨이 붙은 지표 모두 제거 (예: 길드 퇴장 시)"""
+        items = tuple(labels.items())
+        with self._lock:
+            for key in [key for key in self._metrics if all(item in key[1] for item in items)]:
+                del self._metrics[key]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """모든 지표의 현재 값"""
+        result = {}
+        for (name, labels), metric in list(self._metrics.items()):
+            label_text = ','.join(f"{k}={v}" for k, v in labels)
+            key = f"{name}{{{label_text}}}" if label_text else name
+            result[key] = metric.value if isinstance(metric, Counter) else metric.summary()
+        return result
+
+
+# 프로세스 전체에서 공유하는 기본 저장소
+registry = MetricsRegistry()
@@ -0,0 +1,24 @@
+import os
+from typing import Optional
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+def process_rss(pid: Optional[int] = None) -> Optional[int]:
+    """프로세스의 메모리 사용량(RSS, 바이트) (pid가 없으면 현재 프로세스, 읽을 수 없으면 None)
+
+    psutil이 없으면 /proc/<pid>/statm을 읽으므로 Linux에서만 값이 나온다.
+    """
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).memory_info().rss
+        except psutil.Error:
+            return None
+    try:
+        with open(f"/proc/{'self' if pid is None else pid}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None